@@ -0,0 +1,430 @@
+"""
+File: benchmark_dp.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import argparse
+import csv
+import importlib
+import inspect
+import json
+import math
+import platform
+import random
+import sys
+import tracemalloc
+
+DP_DIR = Path(__file__).parent / "chapter_dynamic_programming"
+sys.path.insert(0, str(DP_DIR))
+
+
+def gen_knapsack(size: int) -> tuple:
+    """16 items, capacity size"""
+    rng = random.Random(size)
+    wgt = [rng.randint(1, max(1, size // 4)) for _ in range(16)]
+    val = [rng.randint(1, 1000) for _ in range(16)]
+    return wgt, val, size
+
+
+def gen_bounded_knapsack(size: int) -> tuple:
+    """10 items with up to 20 copies each, capacity size"""
+    rng = random.Random(size)
+    wgt = [rng.randint(1, max(1, size // 8)) for _ in range(10)]
+    val = [rng.randint(1, 1000) for _ in range(10)]
+    cnt = [rng.randint(1, 20) for _ in range(10)]
+    return wgt, val, cnt, size
+
+
+def gen_strings(size: int) -> tuple:
+    """Two random DNA strings of length size"""
+    rng = random.Random(size)
+    s = "".join(rng.choice("acgt") for _ in range(size))
+    t = "".join(rng.choice("acgt") for _ in range(size))
+    return s, t
+
+
+def gen_grid(size: int) -> tuple:
+    """A size x size grid of costs 0..99"""
+    rng = random.Random(size)
+    return ([[rng.randint(0, 99) for _ in range(size)] for _ in range(size)],)
+
+
+def gen_stairs(size: int) -> tuple:
+    """Staircase of size steps"""
+    return (size,)
+
+
+def gen_costs(size: int) -> tuple:
+    """Costs of size + 1 steps, the ground included"""
+    rng = random.Random(size)
+    return ([0] + [rng.randint(1, 100) for _ in range(size)],)
+
+
+def gen_coins(size: int) -> tuple:
+    """12 coin values up to 100, target amount size"""
+    rng = random.Random(size)
+    return rng.sample(range(1, 101), 12), size
+
+
+def table(n: int, m: int) -> list[list[int]]:
+    """A memo table filled with -1"""
+    return [[-1] * m for _ in range(n)]
+
+
+# For every problem: an input generator taking one size parameter, the sizes to run,
+# the reference variant, adapters for variants whose signature differs from the
+# generated arguments, and size limits for the exponential brute-force variants.
+# Any other function named <problem>_* in chapter_dynamic_programming whose required
+# parameters match the generated arguments is discovered and benchmarked as is.
+PROBLEMS = {
+    "knapsack": {
+        "gen": gen_knapsack,
+        "sizes": [250, 500, 1000, 2000, 4000],
+        "reference": "knapsack_dp",
+        "adapters": {
+            "knapsack_dfs": lambda f, wgt, val, cap: f(wgt, val, len(wgt), cap),
+            "knapsack_dfs_mem": lambda f, wgt, val, cap: f(
+                wgt, val, table(len(wgt) + 1, cap + 1), len(wgt), cap
+            ),
+        },
+        "limits": {},
+    },
+    "bounded_knapsack": {
+        "gen": gen_bounded_knapsack,
+        "sizes": [250, 500, 1000, 2000, 4000],
+        "reference": "bounded_knapsack_naive",
+        "adapters": {},
+        "limits": {},
+    },
+    "unbounded_knapsack": {
+        "gen": gen_knapsack,
+        "sizes": [1000, 2000, 4000, 8000, 16000],
+        "reference": "unbounded_knapsack_dp",
+        "adapters": {},
+        "limits": {},
+    },
+    "edit_distance": {
+        "gen": gen_strings,
+        "sizes": [4, 8, 16, 32, 64, 128, 256, 512],
+        "reference": "edit_distance_dp",
+        "adapters": {
+            "edit_distance_dfs": lambda f, s, t: f(s, t, len(s), len(t)),
+            "edit_distance_dfs_mem": lambda f, s, t: f(
+                s, t, table(len(s) + 1, len(t) + 1), len(s), len(t)
+            ),
+            # A bound of n + m never cuts off the search
+            "edit_distance_bounded": lambda f, s, t: f(s, t, len(s) + len(t)),
+        },
+        "limits": {"edit_distance_dfs": 8},
+    },
+    "min_path_sum": {
+        "gen": gen_grid,
+        "sizes": [4, 8, 16, 32, 64, 128, 256],
+        "reference": "min_path_sum_dp",
+        "adapters": {
+            "min_path_sum_dfs": lambda f, grid: f(grid, len(grid) - 1, len(grid[0]) - 1),
+            "min_path_sum_dfs_mem": lambda f, grid: f(
+                grid, table(len(grid), len(grid[0])), len(grid) - 1, len(grid[0]) - 1
+            ),
+            # Only moving right or down solves the same problem as the dp
+            "min_path_sum_dijkstra": lambda f, grid: f(grid, moves=2),
+        },
+        "limits": {"min_path_sum_dfs": 8},
+    },
+    "climbing_stairs": {
+        "gen": gen_stairs,
+        "sizes": [8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096],
+        "reference": "climbing_stairs_dp",
+        "adapters": {},
+        "limits": {"climbing_stairs_dfs": 24, "climbing_stairs_backtrack": 24},
+    },
+    "climbing_stairs_constraint": {
+        "gen": gen_stairs,
+        "sizes": [8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096],
+        "reference": "climbing_stairs_constraint_dp",
+        "adapters": {},
+        "limits": {},
+    },
+    "min_cost_climbing_stairs": {
+        "gen": gen_costs,
+        "sizes": [1000, 2000, 4000, 8000, 16000, 32000],
+        "reference": "min_cost_climbing_stairs_dp",
+        "adapters": {},
+        "limits": {},
+    },
+    "coin_change": {
+        "gen": gen_coins,
+        "sizes": [1000, 2000, 4000, 8000, 16000],
+        "reference": "coin_change_dp",
+        "adapters": {},
+        "limits": {},
+    },
+    "coin_change_ii": {
+        "gen": gen_coins,
+        "sizes": [1000, 2000, 4000, 8000, 16000],
+        "reference": "coin_change_ii_dp",
+        "adapters": {},
+        "limits": {},
+    },
+}
+
+
+# Variants that do their work in a process pool: tracemalloc only sees the parent
+# process and their timing is dominated by pool start-up at these sizes, so neither
+# a memory peak nor a complexity exponent is reported for them
+POOL_VARIANTS = {"edit_distance_tiled", "min_path_sum_tiled"}
+
+
+def discover(problems: list[str]) -> tuple[dict, list[str], list[str]]:
+    """Find the variant functions of each problem in chapter_dynamic_programming"""
+    variants = {name: {} for name in problems}
+    skipped = []
+    unavailable = []
+    # A function belongs to the longest problem name it starts with, so that
+    # coin_change_ii_dp is not taken for a coin_change variant
+    prefixes = sorted(PROBLEMS, key=len, reverse=True)
+    for path in sorted(DP_DIR.glob("*.py")):
+        try:
+            module = importlib.import_module(path.stem)
+        except ImportError as e:
+            # e.g. the NumPy versions when NumPy is not installed
+            unavailable.append(f"{path.name} ({e})")
+            continue
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            # Skip functions imported from sibling files
+            if func.__module__ != module.__name__:
+                continue
+            problem = next((p for p in prefixes if name.startswith(p + "_")), None)
+            if problem not in variants:
+                continue
+            spec = PROBLEMS[problem]
+            if name in spec["adapters"]:
+                variants[problem][name] = (func, spec["adapters"][name])
+                continue
+            params = inspect.signature(func).parameters.values()
+            required = [p for p in params if p.default is inspect.Parameter.empty]
+            nargs = len(spec["gen"](spec["sizes"][0]))
+            if len(required) == nargs and not inspect.isgeneratorfunction(func):
+                variants[problem][name] = (func, None)
+            else:
+                skipped.append(name)
+    return variants, skipped, unavailable
+
+
+def call(func, adapter, args: tuple):
+    """Run one variant, reducing (value, solution) results to the value"""
+    res = adapter(func, *args) if adapter else func(*args)
+    return res[0] if isinstance(res, tuple) else res
+
+
+def measure(func, adapter, args: tuple, repeat: int, trace: bool = True) -> tuple:
+    """Best wall time of repeat runs, then the tracemalloc peak of one more run"""
+    best = math.inf
+    for _ in range(repeat):
+        start = timer()
+        res = call(func, adapter, args)
+        best = min(best, timer() - start)
+    if not trace:
+        return res, best, None
+    tracemalloc.start()
+    try:
+        call(func, adapter, args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return res, best, peak
+
+
+def run_problem(name: str, variants: dict, budget: float, repeat: int) -> list[dict]:
+    """Run all variants of one problem on growing inputs"""
+    spec = PROBLEMS[name]
+    records = []
+    # Variants stop growing once a run exceeds the budget or fails
+    active = set(variants)
+    for size in spec["sizes"]:
+        args = spec["gen"](size)
+        results = {}
+        for variant, (func, adapter) in variants.items():
+            if variant not in active or size > spec["limits"].get(variant, math.inf):
+                continue
+            record = {"problem": name, "variant": variant, "size": size}
+            try:
+                res, seconds, peak = measure(
+                    func, adapter, args, repeat, variant not in POOL_VARIANTS
+                )
+            except (RecursionError, MemoryError) as e:
+                record.update(seconds=None, peak_bytes=None, agrees=None)
+                record["error"] = type(e).__name__
+                active.discard(variant)
+            else:
+                results[variant] = res
+                record.update(seconds=seconds, peak_bytes=peak, agrees=None, error="")
+                if seconds > budget:
+                    active.discard(variant)
+            records.append(record)
+        # Check every result of this size against the reference (or the first result)
+        if results:
+            expected = results.get(spec["reference"], next(iter(results.values())))
+            for record in records:
+                if record["size"] == size and record["variant"] in results:
+                    record["agrees"] = results[record["variant"]] == expected
+    return records
+
+
+def fit_exponent(points: list[tuple[int, float]]) -> float | None:
+    """Slope of log(time) against log(size) by least squares"""
+    # Runs that are too short are dominated by call overhead
+    points = [(n, t) for n, t in points if t >= 1e-5]
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+
+
+def fit_all(records: list[dict]) -> list[dict]:
+    """Empirical complexity exponent of every variant"""
+    curves = {}
+    for r in records:
+        if r["seconds"] is not None:
+            curves.setdefault((r["problem"], r["variant"]), []).append(
+                (r["size"], r["seconds"])
+            )
+    return [
+        {
+            "problem": problem,
+            "variant": variant,
+            "exponent": None if variant in POOL_VARIANTS else fit_exponent(points),
+            "points": len(points),
+        }
+        for (problem, variant), points in curves.items()
+    ]
+
+
+def compare(report: dict, baseline: dict, tolerance: float, slowdown: float) -> list[str]:
+    """Regressions of report against a baseline report"""
+    regressions = []
+    old_fits = {(f["problem"], f["variant"]): f["exponent"] for f in baseline["fits"]}
+    for f in report["fits"]:
+        old = old_fits.get((f["problem"], f["variant"]))
+        if old is not None and f["exponent"] is not None and f["exponent"] > old + tolerance:
+            regressions.append(
+                f"{f['variant']}: exponent {old:.2f} -> {f['exponent']:.2f}"
+            )
+    old_times = {
+        (r["problem"], r["variant"], r["size"]): r["seconds"] for r in baseline["results"]
+    }
+    for r in report["results"]:
+        old = old_times.get((r["problem"], r["variant"], r["size"]))
+        # Only compare runs long enough to be measured reliably
+        if old and r["seconds"] and old >= 1e-2 and r["seconds"] > old * slowdown:
+            regressions.append(
+                f"{r['variant']} at size {r['size']}: {old:.4f} s -> {r['seconds']:.4f} s"
+            )
+    for r in report["results"]:
+        if r["agrees"] is False:
+            regressions.append(f"{r['variant']} at size {r['size']}: wrong result")
+    return regressions
+
+
+def write_csv(path: str, records: list[dict]):
+    """One row per (variant, size) run"""
+    fields = ["problem", "variant", "size", "seconds", "peak_bytes", "agrees", "error"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark every variant in chapter_dynamic_programming"
+    )
+    parser.add_argument("problems", nargs="*", help=f"subset of {', '.join(PROBLEMS)}")
+    parser.add_argument("--json", help="write the full report to this JSON file")
+    parser.add_argument("--csv", help="write one row per run to this CSV file")
+    parser.add_argument("--baseline", help="JSON report to check for regressions")
+    parser.add_argument(
+        "--budget", type=float, default=1.0, help="stop growing a variant after a run this long (s)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size, best kept")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.3, help="allowed increase of a fitted exponent"
+    )
+    parser.add_argument(
+        "--slowdown", type=float, default=1.5, help="allowed time ratio against the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    names = args.problems or list(PROBLEMS)
+    unknown = [name for name in names if name not in PROBLEMS]
+    if unknown:
+        parser.error(f"unknown problems: {', '.join(unknown)}")
+    variants, skipped, unavailable = discover(names)
+
+    records = []
+    for name in names:
+        print(f"{name}: {', '.join(variants[name])}")
+        records += run_problem(name, variants[name], args.budget, args.repeat)
+    if skipped:
+        print(f"Skipped (signature does not match the generated inputs): {', '.join(skipped)}")
+    if unavailable:
+        print(f"Skipped (import failed): {', '.join(unavailable)}")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": records,
+        "fits": fit_all(records),
+    }
+
+    print(f"\n{'variant':>34} {'exponent':>9} {'max size':>9} {'time (s)':>10} {'peak (KiB)':>11}")
+    for f in report["fits"]:
+        last = [
+            r for r in records
+            if r["variant"] == f["variant"] and r["seconds"] is not None
+        ][-1]
+        exponent = "-" if f["exponent"] is None else f"{f['exponent']:.2f}"
+        peak = "-" if last["peak_bytes"] is None else f"{last['peak_bytes'] / 1024:.1f}"
+        print(
+            f"{f['variant']:>34} {exponent:>9} {last['size']:>9} "
+            f"{last['seconds']:>10.4f} {peak:>11}"
+        )
+    if any(f["variant"] in POOL_VARIANTS for f in report["fits"]):
+        print("Process pool variants (no peak, no exponent): " + ", ".join(sorted(POOL_VARIANTS)))
+    for r in records:
+        if r["error"]:
+            print(f"{r['variant']} failed at size {r['size']}: {r['error']}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.csv:
+        write_csv(args.csv, records)
+
+    regressions = [
+        f"{r['variant']} at size {r['size']}: wrong result"
+        for r in records
+        if r["agrees"] is False
+    ]
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance, args.slowdown)
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+File: benchmark_heap.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from timeit import default_timer as timer
+import argparse
+import heapq
+import random
+
+from modules import Heap
+
+
+def heapq_ops(prios: list[int], extra: list[int]) -> list[int]:
+    """heapify, push, pushpop and pop everything with heapq, entries are (priority, item)"""
+    n = len(prios)
+    heap = [(p, i) for i, p in enumerate(prios)]
+    heapq.heapify(heap)
+    for i, p in enumerate(extra):
+        heapq.heappush(heap, (p, n + i))
+    out = [heapq.heappushpop(heap, (p, 2 * n + i))[0] for i, p in enumerate(extra)]
+    while heap:
+        out.append(heapq.heappop(heap)[0])
+    return out
+
+
+def heap_ops(prios: list[int], extra: list[int], d: int) -> list[int]:
+    """The same operations with Heap"""
+    n = len(prios)
+    heap = Heap(((p, i) for i, p in enumerate(prios)), d)
+    for i, p in enumerate(extra):
+        heap.push(p, n + i)
+    out = [heap.pushpop(p, 2 * n + i)[0] for i, p in enumerate(extra)]
+    while heap:
+        out.append(heap.pop()[0])
+    return out
+
+
+def heapq_decrease(prios: list[int], updates: list[tuple[int, int]]) -> list[int]:
+    """Decrease keys with heapq: push a new entry, skip stale ones when popping"""
+    best = list(prios)
+    heap = [(p, i) for i, p in enumerate(prios)]
+    heapq.heapify(heap)
+    for i, p in updates:
+        if p < best[i]:
+            best[i] = p
+            heapq.heappush(heap, (p, i))
+    out = []
+    while heap:
+        p, i = heapq.heappop(heap)
+        if p == best[i]:
+            out.append(p)
+            # Later entries for i are stale
+            best[i] = -1
+    return out
+
+
+def heap_decrease(prios: list[int], updates: list[tuple[int, int]], d: int) -> list[int]:
+    """Decrease keys in place with Heap.decrease_key"""
+    heap = Heap(((p, i) for i, p in enumerate(prios)), d)
+    for i, p in updates:
+        if p < heap.prio[heap.pos[i]]:
+            heap.decrease_key(i, p)
+    out = []
+    while heap:
+        out.append(heap.pop()[0])
+    return out
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Heap against heapq")
+    parser.add_argument("-n", type=int, default=100_000, help="number of entries")
+    n = parser.parse_args().n
+
+    random.seed(0)
+    prios = [random.randint(0, 10**9) for _ in range(n)]
+    extra = [random.randint(0, 10**9) for _ in range(n)]
+    updates = [(random.randrange(n), random.randint(0, 10**9)) for _ in range(2 * n)]
+
+    print(f"n = {n}: heapify, n push, n pushpop, pop all")
+    start = timer()
+    expected = heapq_ops(prios, extra)
+    print(f"{'heapq':>10}: {timer() - start:.3f} s")
+    for d in [2, 4, 8]:
+        start = timer()
+        assert heap_ops(prios, extra, d) == expected
+        print(f"{f'Heap d={d}':>10}: {timer() - start:.3f} s")
+
+    print(f"\nn = {n}: heapify, {len(updates)} decrease-key attempts, pop all")
+    start = timer()
+    expected = heapq_decrease(prios, updates)
+    print(f"{'heapq':>10}: {timer() - start:.3f} s (lazy deletion)")
+    for d in [2, 4, 8]:
+        start = timer()
+        assert heap_decrease(prios, updates, d) == expected
+        print(f"{f'Heap d={d}':>10}: {timer() - start:.3f} s")
@@ -0,0 +1,134 @@
+"""
+File: benchmark_nodes.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from timeit import default_timer as timer
+import argparse
+import tracemalloc
+
+from modules import (
+    ListNode,
+    TreeNode,
+    Vertex,
+    LinkedListArena,
+    TreeArena,
+    list_to_linked_list,
+    list_to_tree,
+)
+
+
+class DictListNode:
+    """ListNode without __slots__, as the class was before"""
+
+    def __init__(self, val: int):
+        self.val = val
+        self.next = None
+
+
+class DictTreeNode:
+    """TreeNode without __slots__, as the class was before"""
+
+    def __init__(self, val: int = 0):
+        self.val = val
+        self.height = 0
+        self.left = None
+        self.right = None
+
+
+class DictVertex:
+    """Vertex without __slots__, as the class was before"""
+
+    def __init__(self, val: int):
+        self.val = val
+
+
+def build_linked_list(cls, n: int):
+    """Chain of n nodes of class cls"""
+    dum = head = cls(0)
+    for i in range(n):
+        head.next = cls(i)
+        head = head.next
+    return dum.next
+
+
+def build_tree(cls, n: int):
+    """Complete binary tree of n nodes of class cls, in level order"""
+    nodes = [cls(i) for i in range(n)]
+    for i in range(n):
+        if 2 * i + 1 < n:
+            nodes[i].left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            nodes[i].right = nodes[2 * i + 2]
+    return nodes[0] if nodes else None
+
+
+def sum_linked_list(head) -> int:
+    """Sum of values, following .next"""
+    res = 0
+    while head:
+        res += head.val
+        head = head.next
+    return res
+
+
+def sum_tree(root) -> int:
+    """Sum of values, following .left and .right with an explicit stack"""
+    res = 0
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        res += node.val
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+    return res
+
+
+def measure(build, *args) -> tuple:
+    """Built structure, traced bytes it holds and build time"""
+    # Time an untraced build, tracing slows allocations down
+    start = timer()
+    build(*args)
+    seconds = timer() - start
+    tracemalloc.start()
+    res = build(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return res, size, seconds
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory of node classes vs arenas")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of nodes")
+    n = parser.parse_args().n
+    vals = list(range(n))
+
+    # Small structures behave the same whatever the representation
+    assert sum_linked_list(list_to_linked_list(vals[:100])) == sum(vals[:100])
+    assert sum_tree(list_to_tree(vals[:100])) == sum(vals[:100])
+
+    print(f"{n} nodes")
+    print(f"{'structure':>28} {'bytes/node':>11} {'build (s)':>10} {'traverse (s)':>13}")
+    for name, build, args, traverse in [
+        ("ListNode without __slots__", build_linked_list, (DictListNode, n), sum_linked_list),
+        ("ListNode", build_linked_list, (ListNode, n), sum_linked_list),
+        ("LinkedListArena", lambda: LinkedListArena.from_list(vals).node(0), (), sum_linked_list),
+        ("TreeNode without __slots__", build_tree, (DictTreeNode, n), sum_tree),
+        ("TreeNode", build_tree, (TreeNode, n), sum_tree),
+        ("TreeArena", lambda: TreeArena.from_list(vals).node(0), (), sum_tree),
+        ("Vertex without __slots__", lambda: [DictVertex(v) for v in vals], (), None),
+        ("Vertex", lambda: [Vertex(v) for v in vals], (), None),
+    ]:
+        res, size, seconds = measure(build, *args)
+        line = f"{name:>28} {size / n:>11.1f} {seconds:>10.3f}"
+        if traverse:
+            # Arena views are created on the fly, so traversal pays for them
+            start = timer()
+            assert traverse(res) == sum(vals)
+            line += f" {timer() - start:>13.3f}"
+        print(line)
+        del res
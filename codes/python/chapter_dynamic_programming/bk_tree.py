@@ -0,0 +1,130 @@
+"""
+File: bk_tree.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from collections.abc import Iterable
+from timeit import default_timer as timer
+import os
+import pickle
+import random
+import tempfile
+
+from edit_distance import edit_distance_bit_parallel, edit_distance_dp
+
+
+class BKTree:
+    """BK-tree: metric index over a string corpus under edit distance"""
+
+    def __init__(self, words: Iterable[str] = ()):
+        # Nodes are stored in flat lists, node 0 is the root
+        self.words: list[str] = []  # Word of each node
+        self.children: list[dict[int, int]] = []  # Distance to parent -> child node
+        self.build(words)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def build(self, words: Iterable[str]):
+        """Insert every word of the corpus"""
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word: str) -> bool:
+        """Insert a word, return False if it is already in the tree"""
+        if not self.words:
+            self.words.append(word)
+            self.children.append({})
+            return True
+        node = 0
+        while True:
+            d = edit_distance_bit_parallel(word, self.words[node])
+            if d == 0:
+                return False
+            child = self.children[node].get(d)
+            if child is None:
+                # Attach a new leaf at distance d from the current node
+                self.children[node][d] = len(self.words)
+                self.words.append(word)
+                self.children.append({})
+                return True
+            node = child
+
+    def query(self, word: str, max_dist: int) -> list[tuple[int, str]]:
+        """All (distance, word) pairs within max_dist of word, nearest first"""
+        res = []
+        if not self.words:
+            return res
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            d = edit_distance_bit_parallel(word, self.words[node])
+            if d <= max_dist:
+                res.append((d, self.words[node]))
+            # By the triangle inequality, matches can only lie in the subtrees
+            # whose distance to this node is within [d - max_dist, d + max_dist]
+            for dist, child in self.children[node].items():
+                if d - max_dist <= dist <= d + max_dist:
+                    stack.append(child)
+        res.sort()
+        return res
+
+    def save(self, path: str):
+        """Serialize the tree to disk"""
+        with open(path, "wb") as f:
+            pickle.dump((self.words, self.children), f, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "BKTree":
+        """Deserialize a tree saved by save"""
+        tree = cls()
+        with open(path, "rb") as f:
+            tree.words, tree.children = pickle.load(f)
+        return tree
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    words = ["book", "books", "cake", "boo", "boon", "cook", "cape", "cart"]
+    tree = BKTree(words)
+    word, max_dist = "bo", 2
+    res = tree.query(word, max_dist)
+    print(f"Words within {max_dist} edits of {word} are {res}")
+
+    # Incremental insertion
+    tree.insert("bob")
+    res = tree.query(word, max_dist)
+    print(f"After inserting bob, words within {max_dist} edits of {word} are {res}")
+
+    # Save to disk and load it back
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bk_tree.pkl")
+        tree.save(path)
+        tree = BKTree.load(path)
+    print(f"Loaded {len(tree)} words, query result is {tree.query(word, max_dist)}")
+
+    # Benchmark: linear scan vs BK-tree on a random corpus
+    random.seed(0)
+    corpus = list(
+        {
+            "".join(random.choice("abcdefgh") for _ in range(random.randint(4, 10)))
+            for _ in range(20000)
+        }
+    )
+    queries = random.sample(corpus, 20)
+    start = timer()
+    tree = BKTree(corpus)
+    print(f"\nBuilt a BK-tree of {len(tree)} words in {timer() - start:.4f} s")
+    start = timer()
+    expected = [
+        sorted((d, w) for w in corpus if (d := edit_distance_dp(q, w)) <= 1)
+        for q in queries[:2]
+    ]
+    t_scan = (timer() - start) / 2 * len(queries)
+    start = timer()
+    res = [tree.query(q, 1) for q in queries]
+    t_tree = timer() - start
+    assert res[:2] == expected
+    print(f"{len(queries)} queries, linear scan (estimated): {t_scan:.4f} s")
+    print(f"{len(queries)} queries, BK-tree: {t_tree:.4f} s")
@@ -0,0 +1,114 @@
+"""
+File: bounded_knapsack.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from collections import deque
+from timeit import default_timer as timer
+import random
+
+from knapsack import knapsack_dp_comp
+
+
+def bounded_knapsack_naive(
+    wgt: list[int], val: list[int], cnt: list[int], cap: int
+) -> int:
+    """Bounded knapsack: Expand every copy into a 0-1 item"""
+    items_wgt, items_val = [], []
+    for w, v, k in zip(wgt, val, cnt):
+        items_wgt += [w] * k
+        items_val += [v] * k
+    return knapsack_dp_comp(items_wgt, items_val, cap)
+
+
+def bounded_knapsack_binary(
+    wgt: list[int], val: list[int], cnt: list[int], cap: int
+) -> int:
+    """Bounded knapsack: Binary splitting into O(log cnt) 0-1 items per item"""
+    items_wgt, items_val = [], []
+    for w, v, k in zip(wgt, val, cnt):
+        # Bundles of 1, 2, 4, ... copies plus the remainder can make up any count 0..k
+        size = 1
+        while k > 0:
+            take = min(size, k)
+            items_wgt.append(w * take)
+            items_val.append(v * take)
+            k -= take
+            size *= 2
+    return knapsack_dp_comp(items_wgt, items_val, cap)
+
+
+def bounded_knapsack_monotone_queue(
+    wgt: list[int], val: list[int], cnt: list[int], cap: int
+) -> int:
+    """Bounded knapsack: Sliding-window maximum with a monotone deque, O(n * cap)"""
+    dp = [0] * (cap + 1)
+    for w, v, k in zip(wgt, val, cnt):
+        if w > cap or k == 0:
+            continue
+        # Capacities r, r + w, r + 2w, ... only depend on each other:
+        # with x[j] = dp[r + j * w], new x[i] = max over i - k <= j <= i of (x[j] - j * v) + i * v
+        for r in range(w):
+            prev = dp[r::w]
+            window = deque()  # Indices j whose x[j] - j * v is decreasing
+            for i, x in enumerate(prev):
+                key = x - i * v
+                # Drop candidates that can no longer be the maximum
+                while window and prev[window[-1]] - window[-1] * v <= key:
+                    window.pop()
+                window.append(i)
+                # Drop the candidate that needs more than k copies
+                if window[0] < i - k:
+                    window.popleft()
+                j = window[0]
+                dp[r + i * w] = prev[j] - j * v + i * v
+    return dp[cap]
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    wgt = [10, 20, 30, 40, 50]
+    val = [50, 120, 150, 210, 240]
+    cnt = [3, 2, 1, 2, 1]
+    cap = 100
+
+    res = bounded_knapsack_naive(wgt, val, cnt, cap)
+    print(f"The maximum item value without exceeding knapsack capacity is {res}")
+
+    res = bounded_knapsack_binary(wgt, val, cnt, cap)
+    print(f"The maximum item value without exceeding knapsack capacity is {res}")
+
+    res = bounded_knapsack_monotone_queue(wgt, val, cnt, cap)
+    print(f"The maximum item value without exceeding knapsack capacity is {res}")
+
+    # Cross-check on random inputs
+    random.seed(0)
+    for _ in range(300):
+        n = random.randint(1, 5)
+        cap = random.randint(0, 60)
+        wgt = [random.randint(1, 20) for _ in range(n)]
+        val = [random.randint(0, 30) for _ in range(n)]
+        cnt = [random.randint(0, 6) for _ in range(n)]
+        expected = bounded_knapsack_naive(wgt, val, cnt, cap)
+        assert bounded_knapsack_binary(wgt, val, cnt, cap) == expected
+        assert bounded_knapsack_monotone_queue(wgt, val, cnt, cap) == expected
+
+    # Benchmark: naive expansion vs binary splitting vs monotone queue
+    print(f"\n{'n':>4} {'cnt':>6} {'cap':>6} {'naive':>10} {'binary':>10} {'queue':>10}")
+    for n, max_cnt, cap in [(10, 10, 2000), (10, 100, 2000), (10, 300, 3000)]:
+        wgt = [random.randint(1, 100) for _ in range(n)]
+        val = [random.randint(1, 1000) for _ in range(n)]
+        cnt = [random.randint(1, max_cnt) for _ in range(n)]
+        times = []
+        results = []
+        for func in [
+            bounded_knapsack_naive,
+            bounded_knapsack_binary,
+            bounded_knapsack_monotone_queue,
+        ]:
+            start = timer()
+            results.append(func(wgt, val, cnt, cap))
+            times.append(timer() - start)
+        assert results[0] == results[1] == results[2]
+        print(f"{n:>4} {max_cnt:>6} {cap:>6} " + " ".join(f"{t:>10.4f}" for t in times))
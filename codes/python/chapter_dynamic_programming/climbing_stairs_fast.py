@@ -0,0 +1,148 @@
+"""
+File: climbing_stairs_fast.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from timeit import default_timer as timer
+
+from climbing_stairs_constraint_dp import climbing_stairs_constraint_dp
+from climbing_stairs_dp import climbing_stairs_dp, climbing_stairs_dp_comp
+
+
+def mat_mul(a: list[list[int]], b: list[list[int]], mod: int | None) -> list[list[int]]:
+    """Matrix multiplication, reduced modulo mod if given"""
+    k = len(b)
+    res = [
+        [sum(a[i][t] * b[t][j] for t in range(k)) for j in range(len(b[0]))]
+        for i in range(len(a))
+    ]
+    if mod:
+        res = [[x % mod for x in row] for row in res]
+    return res
+
+
+def mat_pow(mat: list[list[int]], p: int, mod: int | None) -> list[list[int]]:
+    """Matrix power by repeated squaring"""
+    k = len(mat)
+    # Start from the identity matrix
+    res = [[int(i == j) for j in range(k)] for i in range(k)]
+    while p:
+        if p & 1:
+            res = mat_mul(res, mat, mod)
+        mat = mat_mul(mat, mat, mod)
+        p >>= 1
+    return res
+
+
+def climbing_stairs_matrix(n: int, mod: int | None = None) -> int:
+    """Climbing stairs: 2 x 2 matrix power"""
+    if n < 1:
+        raise ValueError("the staircase must have at least 1 step")
+    if n <= 2:
+        return n % mod if mod else n
+    # [dp[i], dp[i-1]] = [[1, 1], [1, 0]] * [dp[i-1], dp[i-2]]
+    m = mat_pow([[1, 1], [1, 0]], n - 2, mod)
+    # Apply to the initial state [dp[2], dp[1]] = [2, 1]
+    res = m[0][0] * 2 + m[0][1] * 1
+    return res % mod if mod else res
+
+
+def climbing_stairs_fast_doubling(n: int, mod: int | None = None) -> int:
+    """Climbing stairs: Fast doubling, dp[n] is the Fibonacci number F(n+1)"""
+    if n < 1:
+        raise ValueError("the staircase must have at least 1 step")
+    # Keep (F(k), F(k+1)), scanning the bits of n + 1 from the highest
+    a, b = 0, 1
+    for bit in bin(n + 1)[2:]:
+        # F(2k) = F(k) * (2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod:
+            c, d = c % mod, d % mod
+        # Step from k to 2k, or to 2k + 1 if the bit is set
+        a, b = (d, c + d) if bit == "1" else (c, d)
+        if mod:
+            b %= mod
+    return a
+
+
+def climbing_stairs_constraint_matrix(n: int, mod: int | None = None) -> int:
+    """Constrained climbing stairs: 3 x 3 matrix power"""
+    if n < 1:
+        raise ValueError("the staircase must have at least 1 step")
+    if n <= 2:
+        return 1 % mod if mod else 1
+    # With a[i] = dp[i][1], b[i] = dp[i][2]: a[i] = b[i-1], so
+    # b[i] = a[i-2] + b[i-2] = b[i-3] + b[i-2], a recurrence on b alone
+    # [b[i], b[i-1], b[i-2]] = [[0, 1, 1], [1, 0, 0], [0, 1, 0]] * [b[i-1], b[i-2], b[i-3]]
+    m = mat_pow([[0, 1, 1], [1, 0, 0], [0, 1, 0]], n - 3, mod)
+    # Apply to the initial state [b[3], b[2], b[1]] = [1, 1, 0]
+    b_n = m[0][0] + m[0][1]
+    b_n1 = m[1][0] + m[1][1]
+    # dp[n][1] + dp[n][2] = b[n-1] + b[n]
+    res = b_n + b_n1
+    return res % mod if mod else res
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    n = 9
+
+    res = climbing_stairs_matrix(n)
+    print(f"Climb {n} steps, there are {res} solutions in total")
+
+    res = climbing_stairs_fast_doubling(n)
+    print(f"Climb {n} steps, there are {res} solutions in total")
+
+    res = climbing_stairs_constraint_matrix(n)
+    print(f"Constrained, climb {n} steps, there are {res} solutions in total")
+
+    # Cross-check against the dynamic programming versions for small n
+    mod = 1_000_000_007
+    for n in range(1, 200):
+        expected = climbing_stairs_dp(n)
+        assert climbing_stairs_matrix(n) == expected
+        assert climbing_stairs_fast_doubling(n) == expected
+        assert climbing_stairs_matrix(n, mod) == expected % mod
+        assert climbing_stairs_fast_doubling(n, mod) == expected % mod
+        expected = climbing_stairs_constraint_dp(n)
+        assert climbing_stairs_constraint_matrix(n) == expected
+        assert climbing_stairs_constraint_matrix(n, mod) == expected % mod
+
+    # Like the dp versions, all three are only defined from 1 step on
+    for func in [
+        climbing_stairs_matrix,
+        climbing_stairs_fast_doubling,
+        climbing_stairs_constraint_matrix,
+    ]:
+        for n in [0, -1]:
+            try:
+                func(n)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{func.__name__}({n}) should raise ValueError")
+
+    # Benchmark: O(n) vs O(log n) for large n
+    n = 100000
+    start = timer()
+    expected = climbing_stairs_dp_comp(n) % mod
+    print(f"\nn = {n}, climbing_stairs_dp_comp: {timer() - start:.4f} s")
+    start = timer()
+    assert climbing_stairs_fast_doubling(n, mod) == expected
+    print(f"n = {n}, climbing_stairs_fast_doubling: {timer() - start:.6f} s")
+    for n in [10**7, 10**9, 10**18]:
+        start = timer()
+        res = climbing_stairs_fast_doubling(n, mod)
+        t_doubling = timer() - start
+        start = timer()
+        assert climbing_stairs_matrix(n, mod) == res
+        t_matrix = timer() - start
+        start = timer()
+        res_constraint = climbing_stairs_constraint_matrix(n, mod)
+        t_constraint = timer() - start
+        print(
+            f"n = {n}, mod = {mod}: {res} ({t_doubling:.6f} s, matrix {t_matrix:.6f} s), "
+            f"constrained {res_constraint} ({t_constraint:.6f} s)"
+        )
@@ -0,0 +1,146 @@
+"""
+File: climbing_stairs_steps.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from timeit import default_timer as timer
+
+from climbing_stairs_backtrack import backtrack
+from climbing_stairs_dp import climbing_stairs_dp
+
+
+def check_input(steps: list[int], n: int):
+    """Reject staircases and step sets the recurrence is not defined for"""
+    if n < 1:
+        raise ValueError("the staircase must have at least 1 step")
+    if not steps or min(steps) < 1:
+        raise ValueError("steps must be a non-empty set of positive sizes")
+
+
+def climbing_stairs_steps_dp(steps: list[int], n: int, mod: int | None = None) -> int:
+    """Climbing stairs with an arbitrary step set: Dynamic programming"""
+    check_input(steps, n)
+    # dp[i] = sum of dp[i - s] over all steps s, with dp[0] = 1
+    dp = [0] * (n + 1)
+    dp[0] = 1
+    for i in range(1, n + 1):
+        dp[i] = sum(dp[i - s] for s in steps if s <= i)
+        if mod:
+            dp[i] %= mod
+    return dp[n]
+
+
+def poly_mul(a: list[int], b: list[int], mod: int | None) -> list[int]:
+    """Multiply polynomials with non-negative coefficients by Kronecker substitution"""
+    if not a or not b:
+        return []
+    # Pack each polynomial into one big integer, one fixed-width slot per coefficient,
+    # wide enough that the product's coefficients never overflow into the next slot
+    bits = max(a).bit_length() + max(b).bit_length() + min(len(a), len(b)).bit_length()
+    width = bits // 8 + 1
+    x = int.from_bytes(b"".join(c.to_bytes(width, "little") for c in a), "little")
+    y = int.from_bytes(b"".join(c.to_bytes(width, "little") for c in b), "little")
+    # Python multiplies big integers with Karatsuba, subquadratic in the length
+    size = len(a) + len(b) - 1
+    raw = (x * y).to_bytes(size * width, "little")
+    res = [
+        int.from_bytes(raw[i : i + width], "little") for i in range(0, len(raw), width)
+    ]
+    if mod:
+        res = [c % mod for c in res]
+    return res
+
+
+def poly_reduce(p: list[int], steps: list[int], k: int, mod: int | None) -> list[int]:
+    """Reduce p modulo the characteristic polynomial x^k - sum(x^(k-s) for s in steps)"""
+    # x^d = x^(d-k) * x^k = sum(x^(d-s) for s in steps), from the highest degree down
+    for d in range(len(p) - 1, k - 1, -1):
+        c = p[d]
+        if c:
+            for s in steps:
+                p[d - s] += c
+            if mod:
+                for s in steps:
+                    p[d - s] %= mod
+    p = p[:k]
+    return p + [0] * (k - len(p))
+
+
+def climbing_stairs_steps_kitamasa(
+    steps: list[int], n: int, mod: int | None = None
+) -> int:
+    """Climbing stairs with an arbitrary step set: Kitamasa's method, O(log n) polynomial products"""
+    check_input(steps, n)
+    steps = sorted(set(steps))
+    k = steps[-1]
+    # Initial terms dp[0..k-1] by dynamic programming
+    init = [0] * k
+    init[0] = 1
+    for i in range(1, k):
+        init[i] = sum(init[i - s] for s in steps if s <= i)
+        if mod:
+            init[i] %= mod
+    if n < k:
+        return init[n]
+    # Compute x^n modulo the characteristic polynomial by scanning the bits of n
+    res = [1] + [0] * (k - 1)
+    for bit in bin(n)[2:]:
+        res = poly_reduce(poly_mul(res, res, mod), steps, k, mod)
+        if bit == "1":
+            # Multiply by x: shift by one and reduce the single overflowing term
+            res = poly_reduce([0] + res, steps, k, mod)
+    # Mapping x^i to dp[i] sends every multiple of the characteristic polynomial to 0,
+    # so dp[n] = sum(res[i] * dp[i])
+    ans = sum(c * v for c, v in zip(res, init))
+    return ans % mod if mod else ans
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    steps = [1, 3, 7, 20]
+    n = 30
+
+    res = climbing_stairs_steps_dp(steps, n)
+    print(f"Steps {steps}, climb {n} steps, there are {res} solutions in total")
+
+    res = climbing_stairs_steps_kitamasa(steps, n)
+    print(f"Steps {steps}, climb {n} steps, there are {res} solutions in total")
+
+    # Cross-check against backtracking and the {1, 2} dynamic programming
+    mod = 1_000_000_007
+    for steps in [[1, 2], [1, 3, 7, 20], [2, 5], [4]]:
+        for n in range(1, 30):
+            res = [0]
+            backtrack(steps, 0, n, res)
+            assert climbing_stairs_steps_dp(steps, n) == res[0]
+            assert climbing_stairs_steps_kitamasa(steps, n) == res[0]
+            assert climbing_stairs_steps_kitamasa(steps, n, mod) == res[0] % mod
+    for n in range(1, 300):
+        assert climbing_stairs_steps_kitamasa([1, 2], n) == climbing_stairs_dp(n)
+
+    # Empty staircases and step sets without a positive size are rejected
+    for steps, n in [([1, 2], 0), ([1, 3, 7, 20], -1), ([], 5), ([0, 1], 5), ([-2, 3], 5)]:
+        for func in [climbing_stairs_steps_dp, climbing_stairs_steps_kitamasa]:
+            try:
+                func(steps, n)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{func.__name__}({steps}, {n}) should raise ValueError")
+
+    # Benchmark: O(n * |steps|) dynamic programming vs Kitamasa's method
+    steps = [1, 3, 7, 20]
+    n = 200000
+    start = timer()
+    expected = climbing_stairs_steps_dp(steps, n, mod)
+    t_dp = timer() - start
+    start = timer()
+    assert climbing_stairs_steps_kitamasa(steps, n, mod) == expected
+    t_kitamasa = timer() - start
+    print(f"\nn = {n}: dynamic programming {t_dp:.4f} s, Kitamasa {t_kitamasa:.4f} s")
+    for steps in [[1, 3, 7, 20], list(range(1, 200, 3))]:
+        n = 10**18
+        start = timer()
+        res = climbing_stairs_steps_kitamasa(steps, n, mod)
+        print(f"k = {max(steps)}, n = {n}, mod = {mod}: {res} ({timer() - start:.4f} s)")
@@ -25,8 +25,8 @@ def coin_change_ii_dp(coins: list[int], amt: int) -> int:
     return dp[n][amt]
 
 
-def coin_change_ii_dp_comp(coins: list[int], amt: int) -> int:
-    """Coin change II: Space-optimized dynamic programming"""
+def coin_change_ii_dp_comp(coins: list[int], amt: int, mod: int | None = None) -> int:
+    """Coin change II: Space-optimized dynamic programming, counted modulo mod if given"""
     n = len(coins)
     # Initialize dp table
     dp = [0] * (amt + 1)
@@ -41,6 +41,9 @@ def coin_change_ii_dp_comp(coins: list[int], amt: int) -> int:
             else:
                 # The sum of the two options of not choosing and choosing coin i
                 dp[a] = dp[a] + dp[a - coins[i - 1]]
+                if mod:
+                    # Keep the counts small instead of growing big integers
+                    dp[a] %= mod
     return dp[amt]
 
 
@@ -56,3 +59,8 @@ if __name__ == "__main__":
     # Space-optimized dynamic programming
     res = coin_change_ii_dp_comp(coins, amt)
     print(f"The number of coin combinations to make up the target amount is {res}")
+
+    # Space-optimized dynamic programming, counted modulo a prime
+    mod = 1_000_000_007
+    res = coin_change_ii_dp_comp(coins, amt, mod)
+    print(f"The number of coin combinations modulo {mod} is {res}")
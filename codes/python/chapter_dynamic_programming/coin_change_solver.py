@@ -0,0 +1,129 @@
+"""
+File: coin_change_solver.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from timeit import default_timer as timer
+import os
+import pickle
+import random
+import tempfile
+
+from coin_change import coin_change_dp_comp
+from coin_change_ii import coin_change_ii_dp_comp
+
+
+class CoinChangeSolver:
+    """Coin change for a fixed coin set: dp tables grown lazily and shared by all queries"""
+
+    def __init__(self, coins: list[int]):
+        self.coins = list(coins)
+        # min_dp[a] is the minimum number of coins for amount a, -1 means unreachable
+        self.min_dp = [0]
+        # count_dp[a] is the number of coin combinations for amount a
+        self.count_dp = [1]
+        # rows[i][a % coins[i]] holds the count of amount a using the first i + 1 coins,
+        # only the last coins[i] amounts of each row are needed to extend the table
+        self.rows = [[0] * c for c in self.coins]
+        for row in self.rows:
+            row[0] = 1
+
+    def grow_min(self, amt: int):
+        """Extend min_dp up to amount amt"""
+        dp = self.min_dp
+        for a in range(len(dp), amt + 1):
+            best = -1
+            for c in self.coins:
+                # The smaller value between the current best and choosing coin c
+                if c <= a and dp[a - c] != -1 and (best == -1 or dp[a - c] + 1 < best):
+                    best = dp[a - c] + 1
+            dp.append(best)
+
+    def grow_count(self, amt: int):
+        """Extend count_dp up to amount amt"""
+        for a in range(len(self.count_dp), amt + 1):
+            # Without any coin, only amount 0 can be made up
+            ways = 0
+            for row, c in zip(self.rows, self.coins):
+                # Not choosing coin i (ways so far) plus choosing it (row i at amount a - c,
+                # which is still 0 if a < c)
+                ways += row[a % c]
+                row[a % c] = ways
+            self.count_dp.append(ways)
+
+    def min_coins(self, amt: int) -> int:
+        """Minimum number of coins to make up amt, -1 if impossible"""
+        if amt < 0:
+            raise ValueError("the amount must be non-negative")
+        if amt >= len(self.min_dp):
+            self.grow_min(amt)
+        return self.min_dp[amt]
+
+    def combinations(self, amt: int) -> int:
+        """Number of coin combinations to make up amt"""
+        if amt < 0:
+            raise ValueError("the amount must be non-negative")
+        if amt >= len(self.count_dp):
+            self.grow_count(amt)
+        return self.count_dp[amt]
+
+    def save(self, path: str):
+        """Serialize the solver and its tables to disk"""
+        with open(path, "wb") as f:
+            pickle.dump(self, f, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "CoinChangeSolver":
+        """Deserialize a solver saved by save"""
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    coins = [1, 2, 5]
+    solver = CoinChangeSolver(coins)
+
+    res = solver.min_coins(4)
+    print(f"Minimum number of coins required to reach the target amount = {res}")
+
+    res = solver.combinations(5)
+    print(f"The number of coin combinations to make up the target amount is {res}")
+
+    # Cross-check against the scalar versions, including unreachable amounts
+    random.seed(0)
+    for coins in [[1, 2, 5], [3, 7], [2], [5, 10, 25, 50]]:
+        solver = CoinChangeSolver(coins)
+        for amt in random.sample(range(200), 100):
+            assert solver.min_coins(amt) == coin_change_dp_comp(coins, amt)
+            assert solver.combinations(amt) == coin_change_ii_dp_comp(coins, amt)
+        # A negative amount must not read the end of the tables
+        for func in [solver.min_coins, solver.combinations]:
+            try:
+                func(-1)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"{func.__name__}(-1) should raise ValueError")
+
+    # Save to disk and load it back
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "coin_change.pkl")
+        solver.save(path)
+        solver = CoinChangeSolver.load(path)
+    print(f"Loaded a solver for coins {solver.coins} with {len(solver.min_dp)} amounts")
+
+    # Benchmark: rebuilding the dp array per query vs one shared table
+    coins = [1, 5, 10, 25, 50, 100]
+    amts = [random.randint(0, 10000) for _ in range(1000)]
+    start = timer()
+    expected = [coin_change_dp_comp(coins, amt) for amt in amts[:20]]
+    t_scalar = (timer() - start) / 20 * len(amts)
+    solver = CoinChangeSolver(coins)
+    start = timer()
+    res = [solver.min_coins(amt) for amt in amts]
+    t_solver = timer() - start
+    assert res[:20] == expected
+    print(f"\n{len(amts)} queries, coin_change_dp_comp (estimated): {t_scalar:.4f} s")
+    print(f"{len(amts)} queries, CoinChangeSolver: {t_solver:.4f} s")
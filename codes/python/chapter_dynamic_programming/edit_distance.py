@@ -99,6 +99,84 @@ def edit_distance_dp_comp(s: str, t: str) -> int:
     return dp[m]
 
 
+def edit_distance_bounded(s: str, t: str, k: int) -> int:
+    """Edit distance: Banded dynamic programming, returns k + 1 if the distance exceeds k"""
+    n, m = len(s), len(t)
+    # Every edit changes the length by at most 1, so the distance is at least |n - m|
+    if abs(n - m) > k:
+        return k + 1
+    # Any value above k is stored as k + 1, including cells outside the band
+    INF = k + 1
+    dp = [min(j, INF) for j in range(m + 1)]
+    # State transition: only the cells with |i - j| <= k in each row
+    for i in range(1, n + 1):
+        lo, hi = max(1, i - k), min(m, i + k)
+        leftup = dp[lo - 1]  # Temporarily store dp[i-1, lo-1]
+        # The cell left of the band is the first column, or outside the band
+        dp[lo - 1] = min(i, INF) if lo == 1 else INF
+        row_min = dp[lo - 1]
+        for j in range(lo, hi + 1):
+            temp = dp[j]
+            if s[i - 1] == t[j - 1]:
+                # If the two characters are equal, skip these two characters
+                dp[j] = leftup
+            else:
+                # The minimum number of edits from three operations (insert, remove, replace) + 1
+                dp[j] = min(dp[j - 1], dp[j], leftup, k) + 1
+            row_min = min(row_min, dp[j])
+            leftup = temp  # Update for the next round of dp[i-1, j-1]
+        # Every path passes through this row, so if all cells exceed k, so does the distance
+        if row_min > k:
+            return INF
+    return dp[m]
+
+
+def build_peq(s: str) -> dict[str, int]:
+    """Pack s into bitmasks: bit i of peq[c] is set if s[i] == c"""
+    peq: dict[str, int] = {}
+    for i, c in enumerate(s):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+
+def edit_distance_peq(peq: dict[str, int], n: int, t: str) -> int:
+    """Edit distance between a string of length n (packed by build_peq) and t: Bit-parallel"""
+    if n == 0:
+        return len(t)
+    mask = (1 << n) - 1
+    high = 1 << (n - 1)
+    # VP/VN hold the positive/negative vertical differences dp[i][j] - dp[i-1][j] of the current column
+    vp, vn = mask, 0
+    dist = n
+    # Process t one character (one whole dp column) at a time
+    for c in t:
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        # Horizontal differences dp[i][j] - dp[i][j-1]
+        hp = vn | (~(xh | vp) & mask)
+        hn = vp & xh
+        # The last row of the column is the distance between s and the prefix of t
+        if hp & high:
+            dist += 1
+        elif hn & high:
+            dist -= 1
+        # Shift in the first row, where dp[0][j] - dp[0][j-1] is always +1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(xv | hp) & mask)
+        vn = hp & xv
+    return dist
+
+
+def edit_distance_bit_parallel(s: str, t: str) -> int:
+    """Edit distance: Bit-parallel (Myers/Hyyrö) dynamic programming"""
+    # Pack the shorter string so that the bitmasks are as narrow as possible
+    if len(s) > len(t):
+        s, t = t, s
+    return edit_distance_peq(build_peq(s), len(s), t)
+
+
 """Driver Code"""
 if __name__ == "__main__":
     s = "bag"
@@ -121,3 +199,15 @@ if __name__ == "__main__":
     # Space-optimized dynamic programming
     res = edit_distance_dp_comp(s, t)
     print(f"To change {s} to {t}, the minimum number of edits required is {res}")
+
+    # Banded dynamic programming
+    k = 3
+    res = edit_distance_bounded(s, t, k)
+    print(f"To change {s} to {t} within {k} edits, the minimum number of edits required is {res}")
+    k = 2
+    res = edit_distance_bounded(s, t, k)
+    print(f"To change {s} to {t} within {k} edits, {res} means more than {k} edits are required")
+
+    # Bit-parallel dynamic programming
+    res = edit_distance_bit_parallel(s, t)
+    print(f"To change {s} to {t}, the minimum number of edits required is {res}")
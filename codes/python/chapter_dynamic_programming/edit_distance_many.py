@@ -0,0 +1,109 @@
+"""
+File: edit_distance_many.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from timeit import default_timer as timer
+import random
+
+from edit_distance import build_peq, edit_distance_dp_comp, edit_distance_peq
+
+# Bitmasks of the query, built once per worker process by init_worker
+query_peq: dict[str, int] = {}
+query_len = 0
+
+
+def init_worker(query: str):
+    """Process pool initializer: pack the query once per worker"""
+    global query_peq, query_len
+    query_peq, query_len = build_peq(query), len(query)
+
+
+def distance_chunk(chunk: list[str]) -> list[int]:
+    """Edit distances between the packed query and a chunk of candidates"""
+    return [edit_distance_peq(query_peq, query_len, t) for t in chunk]
+
+
+def edit_distance_many(
+    query: str, candidates: Iterable[str], workers: int = 1, chunk_size: int = 1024
+) -> Iterator[int]:
+    """Edit distances between one query and many candidates, yielded in input order"""
+    # Checked here rather than in the generator, which would only run on the first next()
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return distances(query, iter(candidates), workers, chunk_size)
+
+
+def distances(query: str, it: Iterator[str], workers: int, chunk_size: int) -> Iterator[int]:
+    """Generator behind edit_distance_many"""
+    # Without a pool, reuse the packed query for every candidate in this process
+    if workers == 1:
+        peq, n = build_peq(query), len(query)
+        for t in it:
+            yield edit_distance_peq(peq, n, t)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(query,)
+    ) as pool:
+        # Keep a bounded window of chunks in flight so that the candidates
+        # are consumed lazily and results stream back in order
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(it, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(distance_chunk, chunk))
+            if not pending:
+                break
+            yield from pending.popleft().result()
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    query = "kitten"
+    candidates = ["sitting", "kitchen", "mitten", "", "kitten"]
+    res = list(edit_distance_many(query, candidates))
+    print(f"Edit distances from {query} to {candidates} are {res}")
+
+    # Invalid arguments are rejected on the call, not on the first next()
+    for workers, chunk_size in [(0, 1024), (2, 0), (2, -1)]:
+        try:
+            edit_distance_many(query, candidates, workers, chunk_size)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(
+                f"workers={workers}, chunk_size={chunk_size} should raise ValueError"
+            )
+
+    # Benchmark: scalar loop vs batch API on random candidates
+    random.seed(0)
+    query = "".join(random.choice("acgt") for _ in range(200))
+    candidates = [
+        "".join(random.choice("acgt") for _ in range(random.randint(150, 250)))
+        for _ in range(4000)
+    ]
+    # The scalar function is too slow for the whole batch, time it on a sample
+    sample = candidates[:50]
+    start = timer()
+    expected = [edit_distance_dp_comp(query, t) for t in sample]
+    t_scalar = (timer() - start) / len(sample) * len(candidates)
+    print(f"\n{len(candidates)} candidates of length ~200")
+    print(f"edit_distance_dp_comp loop (estimated): {t_scalar:.4f} s")
+    baseline = None
+    for workers in [1, 2, 4]:
+        start = timer()
+        res = list(edit_distance_many(query, candidates, workers=workers))
+        elapsed = timer() - start
+        assert res[: len(sample)] == expected
+        baseline = res if baseline is None else baseline
+        assert res == baseline
+        print(f"edit_distance_many(workers={workers}): {elapsed:.4f} s")
@@ -0,0 +1,151 @@
+"""
+File: knapsack_items.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from timeit import default_timer as timer
+import random
+import tracemalloc
+
+from knapsack import knapsack_dp
+
+
+def knapsack_dp_bits(wgt: list[int], val: list[int], cap: int) -> tuple[int, list[int]]:
+    """0-1 Knapsack: Space-optimized dynamic programming, keeping one bit per item per capacity"""
+    n = len(wgt)
+    # Initialize dp table
+    dp = [0] * (cap + 1)
+    # take[i] has bit c set if item i is chosen at capacity c, bit c % 8 of byte c // 8.
+    # Setting a bit in place keeps a row O(cap); an int bitmask would be copied on every |=
+    take = [bytearray((cap >> 3) + 1) for _ in range(n)]
+    # State transition
+    for i in range(n):
+        w, v = wgt[i], val[i]
+        bits = take[i]
+        # Traverse in reverse order
+        for c in range(cap, w - 1, -1):
+            if dp[c - w] + v > dp[c]:
+                dp[c] = dp[c - w] + v
+                bits[c >> 3] |= 1 << (c & 7)
+    # Backtrack from the last item to recover the chosen items
+    chosen = []
+    c = cap
+    for i in range(n - 1, -1, -1):
+        if take[i][c >> 3] >> (c & 7) & 1:
+            chosen.append(i)
+            c -= wgt[i]
+    chosen.reverse()
+    return dp[cap], chosen
+
+
+def knapsack_row(wgt: list[int], val: list[int], lo: int, hi: int, cap: int) -> list[int]:
+    """Last dp row for items lo..hi-1, dp[c] is the maximum value within capacity c"""
+    dp = [0] * (cap + 1)
+    for i in range(lo, hi):
+        w, v = wgt[i], val[i]
+        for c in range(cap, w - 1, -1):
+            if dp[c - w] + v > dp[c]:
+                dp[c] = dp[c - w] + v
+    return dp
+
+
+def hirschberg(
+    wgt: list[int], val: list[int], lo: int, hi: int, cap: int, chosen: list[int]
+):
+    """Divide and conquer: append the items chosen from lo..hi-1 within capacity cap"""
+    # If there are no items, nothing can be chosen. Zero remaining capacity is not
+    # a base case, since items of weight 0 still fit
+    if lo >= hi:
+        return
+    # A single item is chosen if it fits and adds value
+    if hi - lo == 1:
+        if wgt[lo] <= cap and val[lo] > 0:
+            chosen.append(lo)
+        return
+    mid = (lo + hi) // 2
+    # Best values of both halves for every capacity
+    left = knapsack_row(wgt, val, lo, mid, cap)
+    right = knapsack_row(wgt, val, mid, hi, cap)
+    # Split the capacity where the two halves together reach the optimum
+    split = max(range(cap + 1), key=lambda c: left[c] + right[cap - c])
+    # Release both rows before recursing so that only O(cap) memory is live per level
+    del left, right
+    hirschberg(wgt, val, lo, mid, split, chosen)
+    hirschberg(wgt, val, mid, hi, cap - split, chosen)
+
+
+def knapsack_hirschberg(
+    wgt: list[int], val: list[int], cap: int
+) -> tuple[int, list[int]]:
+    """0-1 Knapsack: Hirschberg-style divide and conquer, returning the chosen items in O(cap) memory"""
+    chosen = []
+    hirschberg(wgt, val, 0, len(wgt), cap, chosen)
+    return sum(val[i] for i in chosen), chosen
+
+
+def peak_memory(func, *args) -> tuple[object, float, int]:
+    """Run func(*args), return its result, wall time and peak traced memory in bytes"""
+    tracemalloc.start()
+    start = timer()
+    res = func(*args)
+    elapsed = timer() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return res, elapsed, peak
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    wgt = [10, 20, 30, 40, 50]
+    val = [50, 120, 150, 210, 240]
+    cap = 50
+
+    # One bit per item per capacity
+    res, chosen = knapsack_dp_bits(wgt, val, cap)
+    print(f"The maximum item value is {res}, chosen items are {chosen}")
+
+    # Hirschberg-style divide and conquer
+    res, chosen = knapsack_hirschberg(wgt, val, cap)
+    print(f"The maximum item value is {res}, chosen items are {chosen}")
+
+    # Cross-check against every subset on small random instances, including items
+    # of weight 0 and capacity 0 (knapsack_dp never fills capacity 0, so it would
+    # miss items of weight 0)
+    random.seed(0)
+    for _ in range(300):
+        n, cap = random.randint(0, 8), random.randint(0, 20)
+        wgt = [random.randint(0, 12) for _ in range(n)]
+        val = [random.randint(0, 20) for _ in range(n)]
+        expected = max(
+            sum(val[i] for i in range(n) if mask >> i & 1)
+            for mask in range(1 << n)
+            if sum(wgt[i] for i in range(n) if mask >> i & 1) <= cap
+        )
+        for func in [knapsack_dp_bits, knapsack_hirschberg]:
+            res, chosen = func(wgt, val, cap)
+            assert res == expected, (func.__name__, wgt, val, cap)
+            assert sum(wgt[i] for i in chosen) <= cap
+            assert sum(val[i] for i in chosen) == res
+
+    # Benchmark: peak memory of the full table vs the two reconstructions
+    n, cap = 60, 3000
+    wgt = [random.randint(1, cap // 4) for _ in range(n)]
+    val = [random.randint(1, 1000) for _ in range(n)]
+    print(f"\nn = {n}, cap = {cap}")
+    print(f"{'method':>20} {'value':>8} {'time (s)':>10} {'peak (KiB)':>12}")
+    expected = None
+    for name, func in [
+        ("knapsack_dp", knapsack_dp),
+        ("knapsack_dp_bits", knapsack_dp_bits),
+        ("knapsack_hirschberg", knapsack_hirschberg),
+    ]:
+        res, elapsed, peak = peak_memory(func, wgt, val, cap)
+        if isinstance(res, tuple):
+            res, chosen = res
+            # The chosen items must fit and add up to the reported value
+            assert sum(wgt[i] for i in chosen) <= cap
+            assert sum(val[i] for i in chosen) == res
+        expected = res if expected is None else expected
+        assert res == expected, (name, res, expected)
+        print(f"{name:>20} {res:>8} {elapsed:>10.4f} {peak / 1024:>12.1f}")
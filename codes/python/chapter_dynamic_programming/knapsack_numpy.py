@@ -0,0 +1,59 @@
+"""
+File: knapsack_numpy.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from timeit import default_timer as timer
+import random
+
+import numpy as np
+
+from knapsack import knapsack_dp_comp
+
+
+def knapsack_dp_np(wgt: list[int], val: list[int], cap: int) -> int:
+    """0-1 Knapsack: Space-optimized dynamic programming, vectorized with NumPy"""
+    # Initialize dp table as a single int64 row
+    dp = np.zeros(cap + 1, dtype=np.int64)
+    # State transition
+    for w, v in zip(wgt, val):
+        # An item heavier than the knapsack can never be chosen
+        if w > cap:
+            continue
+        if w == 0:
+            # A weightless item is taken whenever it adds value (dp[0] is never
+            # updated, matching the range(cap, 0, -1) loop of the scalar version)
+            dp[1:] += max(v, 0)
+            continue
+        # Update the whole row at once: the right-hand side is evaluated before
+        # the assignment, so every dp[c - w] still holds the value of row i-1,
+        # exactly as the reverse traversal guarantees in the scalar version
+        np.maximum(dp[w:], dp[:-w] + v, out=dp[w:])
+    return int(dp[cap])
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    wgt = [10, 20, 30, 40, 50]
+    val = [50, 120, 150, 210, 240]
+    cap = 50
+
+    # Vectorized dynamic programming
+    res = knapsack_dp_np(wgt, val, cap)
+    print(f"The maximum item value without exceeding knapsack capacity is {res}")
+
+    # Benchmark: pure Python vs NumPy over a grid of (n, cap) sizes
+    random.seed(0)
+    print(f"\n{'n':>6} {'cap':>8} {'python (s)':>12} {'numpy (s)':>12} {'speedup':>9}")
+    for n, cap in [(20, 1000), (50, 5000), (100, 10000), (200, 20000)]:
+        wgt = [random.randint(1, cap // 2) for _ in range(n)]
+        val = [random.randint(1, 1000) for _ in range(n)]
+        start = timer()
+        expected = knapsack_dp_comp(wgt, val, cap)
+        t_py = timer() - start
+        start = timer()
+        res = knapsack_dp_np(wgt, val, cap)
+        t_np = timer() - start
+        assert res == expected, (res, expected)
+        print(f"{n:>6} {cap:>8} {t_py:>12.4f} {t_np:>12.4f} {t_py / t_np:>8.1f}x")
@@ -0,0 +1,104 @@
+"""
+File: knapsack_sparse.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from bisect import bisect_right
+from timeit import default_timer as timer
+import random
+
+from knapsack import knapsack_dp_comp
+
+
+def pareto_merge(
+    a: list[tuple[int, int]], b: list[tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Merge two lists of (weight, value) sorted by weight, keeping only non-dominated states"""
+    res = []
+    i = j = 0
+    while i < len(a) or j < len(b):
+        # Take the lighter state next (on ties, the more valuable one)
+        if j == len(b) or (i < len(a) and (a[i][0], -a[i][1]) < (b[j][0], -b[j][1])):
+            state = a[i]
+            i += 1
+        else:
+            state = b[j]
+            j += 1
+        # A state is dominated if a lighter (or equal) state is at least as valuable
+        if not res or state[1] > res[-1][1]:
+            res.append(state)
+    return res
+
+
+def knapsack_pareto(wgt: list[int], val: list[int], cap: int) -> int:
+    """0-1 Knapsack: Pareto frontier of (weight, value) states, independent of cap's size"""
+    # Non-dominated states sorted by weight, values strictly increasing
+    states = [(0, 0)]
+    for w, v in zip(wgt, val):
+        # States reached by putting in the current item
+        shifted = [(sw + w, sv + v) for sw, sv in states if sw + w <= cap]
+        states = pareto_merge(states, shifted)
+    # The heaviest state has the greatest value
+    return states[-1][1]
+
+
+def subset_sums(wgt: list[int], val: list[int], cap: int) -> list[tuple[int, int]]:
+    """All (weight, value) sums of subsets within capacity cap"""
+    sums = [(0, 0)]
+    for w, v in zip(wgt, val):
+        sums += [(sw + w, sv + v) for sw, sv in sums if sw + w <= cap]
+    return sums
+
+
+def knapsack_meet_in_middle(wgt: list[int], val: list[int], cap: int) -> int:
+    """0-1 Knapsack: Meet in the middle, O(2^(n/2) * n) for n up to about 40"""
+    half = len(wgt) // 2
+    left = subset_sums(wgt[:half], val[:half], cap)
+    # Reduce the right half to its Pareto frontier: best value for each weight bound
+    right = sorted(subset_sums(wgt[half:], val[half:], cap), key=lambda s: (s[0], -s[1]))
+    right = pareto_merge(right, [])
+    right_wgt = [w for w, _ in right]
+    res = 0
+    for w, v in left:
+        # The most valuable right-half state that fits in the remaining capacity
+        k = bisect_right(right_wgt, cap - w) - 1
+        res = max(res, v + right[k][1])
+    return res
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    wgt = [10, 20, 30, 40, 50]
+    val = [50, 120, 150, 210, 240]
+    cap = 50
+
+    res = knapsack_pareto(wgt, val, cap)
+    print(f"The maximum item value without exceeding knapsack capacity is {res}")
+
+    res = knapsack_meet_in_middle(wgt, val, cap)
+    print(f"The maximum item value without exceeding knapsack capacity is {res}")
+
+    # Cross-check against the dense dynamic programming on random inputs
+    random.seed(0)
+    for _ in range(300):
+        n = random.randint(0, 10)
+        cap = random.randint(0, 80)
+        wgt = [random.randint(1, 30) for _ in range(n)]
+        val = [random.randint(0, 30) for _ in range(n)]
+        expected = knapsack_dp_comp(wgt, val, cap)
+        assert knapsack_pareto(wgt, val, cap) == expected
+        assert knapsack_meet_in_middle(wgt, val, cap) == expected
+
+    # Capacity around 10^9, far beyond what a dense dp array could hold
+    n = 30
+    wgt = [random.randint(10**7, 10**8) for _ in range(n)]
+    val = [random.randint(1, 10**6) for _ in range(n)]
+    cap = sum(wgt) // 2
+    print(f"\nn = {n}, cap = {cap}")
+    start = timer()
+    res = knapsack_pareto(wgt, val, cap)
+    print(f"knapsack_pareto: {res} ({timer() - start:.4f} s)")
+    start = timer()
+    assert knapsack_meet_in_middle(wgt, val, cap) == res
+    print(f"knapsack_meet_in_middle: {res} ({timer() - start:.4f} s)")
@@ -0,0 +1,199 @@
+"""
+File: memo_search.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from array import array
+from collections.abc import Callable, MutableSequence
+
+from climbing_stairs_dfs_mem import climbing_stairs_dfs_mem
+from edit_distance import edit_distance_dfs_mem
+from knapsack import knapsack_dfs_mem
+from memo_store import DenseMemo, LRUMemo
+from min_path_sum import min_path_sum_dfs_mem
+
+# Any store indexed by state that returns -1 for a missing record
+Memo = MutableSequence[int] | DenseMemo | LRUMemo
+
+
+def memo_search(
+    root: int,
+    subproblems: Callable[[int], list[int]],
+    combine: Callable[[int, list[int]], int],
+    mem: Memo,
+) -> int:
+    """Memoized search with an explicit stack instead of recursion"""
+    # Each frame holds a state, its subproblems and the values solved so far,
+    # exactly what a recursive call keeps in its local variables
+    stack = [(root, subproblems(root), [])]
+    while True:
+        state, subs, vals = stack[-1]
+        # Solve the next subproblem: from the record, or by pushing a new frame
+        if len(vals) < len(subs):
+            sub = subs[len(vals)]
+            res = mem[sub]
+            if res != -1:
+                vals.append(res)
+            else:
+                stack.append((sub, subproblems(sub), []))
+            continue
+        # All subproblems are solved, record the state and return to the caller
+        stack.pop()
+        res = combine(state, vals)
+        mem[state] = res
+        if not stack:
+            return res
+        stack[-1][2].append(res)
+
+
+def new_mem(size: int) -> array:
+    """Compact memo of size int64 records, -1 means no record"""
+    return array("q", [-1]) * size
+
+
+def knapsack_dfs_mem_iter(
+    wgt: list[int], val: list[int], cap: int, mem: Memo | None = None
+) -> int:
+    """0-1 Knapsack: Memoized search with an explicit stack"""
+    n = len(wgt)
+    # State (i, c) is stored as i * (cap + 1) + c
+
+    def subproblems(state: int) -> list[int]:
+        i, c = divmod(state, cap + 1)
+        # If all items have been chosen or the knapsack has no remaining capacity
+        if i == 0 or c == 0:
+            return []
+        # If exceeding the knapsack capacity, can only choose not to put it in the knapsack
+        if wgt[i - 1] > c:
+            return [state - cap - 1]
+        # Not putting in and putting in item i
+        return [state - cap - 1, state - cap - 1 - wgt[i - 1]]
+
+    def combine(state: int, vals: list[int]) -> int:
+        if len(vals) < 2:
+            return vals[0] if vals else 0
+        return max(vals[0], vals[1] + val[state // (cap + 1) - 1])
+
+    if mem is None:
+        mem = new_mem((n + 1) * (cap + 1))
+    return memo_search(n * (cap + 1) + cap, subproblems, combine, mem)
+
+
+def edit_distance_dfs_mem_iter(s: str, t: str, mem: Memo | None = None) -> int:
+    """Edit distance: Memoized search with an explicit stack"""
+    n, m = len(s), len(t)
+    # State (i, j) is stored as i * (m + 1) + j
+
+    def subproblems(state: int) -> list[int]:
+        i, j = divmod(state, m + 1)
+        # If s or t is empty
+        if i == 0 or j == 0:
+            return []
+        # If the two characters are equal, skip these two characters
+        if s[i - 1] == t[j - 1]:
+            return [state - m - 2]
+        # Insert, delete and replace
+        return [state - 1, state - m - 1, state - m - 2]
+
+    def combine(state: int, vals: list[int]) -> int:
+        if not vals:
+            # The length of the non-empty string
+            return sum(divmod(state, m + 1))
+        if len(vals) == 1:
+            return vals[0]
+        return min(vals) + 1
+
+    if mem is None:
+        mem = new_mem((n + 1) * (m + 1))
+    return memo_search(n * (m + 1) + m, subproblems, combine, mem)
+
+
+def min_path_sum_dfs_mem_iter(grid: list[list[int]], mem: Memo | None = None) -> int:
+    """Minimum path sum: Memoized search with an explicit stack"""
+    n, m = len(grid), len(grid[0])
+    # State (i, j) is stored as i * m + j
+
+    def subproblems(state: int) -> list[int]:
+        i, j = divmod(state, m)
+        # Out-of-bounds cells have a +∞ cost and are simply left out
+        subs = []
+        if i > 0:
+            subs.append(state - m)
+        if j > 0:
+            subs.append(state - 1)
+        return subs
+
+    def combine(state: int, vals: list[int]) -> int:
+        i, j = divmod(state, m)
+        # The top-left cell has no subproblems
+        return (min(vals) if vals else 0) + grid[i][j]
+
+    if mem is None:
+        mem = new_mem(n * m)
+    return memo_search(n * m - 1, subproblems, combine, mem)
+
+
+def climbing_stairs_dfs_mem_iter(n: int, mem: Memo | None = None) -> int:
+    """Climbing stairs: Memoized search with an explicit stack"""
+
+    def subproblems(i: int) -> list[int]:
+        # Known dp[1] and dp[2]
+        if i == 1 or i == 2:
+            return []
+        return [i - 1, i - 2]
+
+    def combine(i: int, vals: list[int]) -> int:
+        return sum(vals) if vals else i
+
+    # The number of solutions grows beyond int64, so keep a list of Python ints
+    if mem is None:
+        mem = [-1] * (n + 1)
+    return memo_search(n, subproblems, combine, mem)
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    # Cross-check against the recursive versions on the chapter examples
+    wgt = [10, 20, 30, 40, 50]
+    val = [50, 120, 150, 210, 240]
+    cap = 50
+    n = len(wgt)
+    res = knapsack_dfs_mem_iter(wgt, val, cap)
+    mem = [[-1] * (cap + 1) for _ in range(n + 1)]
+    assert res == knapsack_dfs_mem(wgt, val, mem, n, cap)
+    print(f"The maximum item value without exceeding knapsack capacity is {res}")
+
+    s, t = "bag", "pack"
+    res = edit_distance_dfs_mem_iter(s, t)
+    mem = [[-1] * (len(t) + 1) for _ in range(len(s) + 1)]
+    assert res == edit_distance_dfs_mem(s, t, mem, len(s), len(t))
+    print(f"To change {s} to {t}, the minimum number of edits required is {res}")
+
+    grid = [[1, 3, 1, 5], [2, 2, 4, 2], [5, 3, 2, 1], [4, 3, 5, 2]]
+    res = min_path_sum_dfs_mem_iter(grid)
+    mem = [[-1] * len(grid[0]) for _ in range(len(grid))]
+    assert res == min_path_sum_dfs_mem(grid, mem, len(grid) - 1, len(grid[0]) - 1)
+    print(f"The minimum path sum from the top-left to the bottom-right corner is {res}")
+
+    n = 9
+    res = climbing_stairs_dfs_mem_iter(n)
+    assert res == climbing_stairs_dfs_mem(n)
+    print(f"Climb {n} steps, there are {res} solutions in total")
+
+    # Search depths far beyond the default recursion limit
+    n = 100000
+    res = climbing_stairs_dfs_mem_iter(n)
+    print(f"\nClimb {n} steps, the number of solutions has {res.bit_length()} bits")
+
+    wgt, val, cap = [1] * n, [1] * n, 5
+    res = knapsack_dfs_mem_iter(wgt, val, cap)
+    print(f"{n} items, the maximum item value is {res}")
+
+    s, t = "a" * 20000, "ab" * 3
+    res = edit_distance_dfs_mem_iter(s, t)
+    print(f"Strings of length {len(s)} and {len(t)}, edit distance is {res}")
+
+    grid = [[1] * 3 for _ in range(n)]
+    res = min_path_sum_dfs_mem_iter(grid)
+    print(f"A {n} x 3 grid, the minimum path sum is {res}")
@@ -0,0 +1,139 @@
+"""
+File: memo_store.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from array import array
+from collections import OrderedDict
+import sys
+
+# Approximate bytes an OrderedDict spends per entry besides the key and value objects
+ENTRY_OVERHEAD = 100
+
+
+class DenseMemo:
+    """Dense memo: one preallocated int64 record per state, -1 means no record"""
+
+    def __init__(self, size: int):
+        self.records = array("q", [-1]) * size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.entries = 0
+        self.peak_entries = 0
+
+    def __getitem__(self, key: int) -> int:
+        res = self.records[key]
+        if res == -1:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return res
+
+    def __setitem__(self, key: int, value: int):
+        if self.records[key] == -1:
+            self.entries += 1
+            self.peak_entries = max(self.peak_entries, self.entries)
+        self.records[key] = value
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the records"""
+        return self.records.itemsize * len(self.records)
+
+    def stats(self) -> dict[str, int]:
+        """Hits, misses, evictions, peak entries and bytes of the memo"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "peak_entries": self.peak_entries,
+            "bytes": self.nbytes,
+        }
+
+
+class LRUMemo:
+    """Sparse memo: records only the states reached, evicting the least recently used beyond max_bytes"""
+
+    def __init__(self, max_bytes: int | None = None):
+        self.records: OrderedDict[int, int] = OrderedDict()
+        self.max_bytes = max_bytes  # None means unbounded, a plain sparse dict
+        self.nbytes = 0  # Approximate bytes held by the records
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.peak_entries = 0
+
+    def __getitem__(self, key: int) -> int:
+        res = self.records.get(key)
+        if res is None:
+            self.misses += 1
+            return -1
+        self.hits += 1
+        # Mark the record as the most recently used
+        self.records.move_to_end(key)
+        return res
+
+    def __setitem__(self, key: int, value: int):
+        old = self.records.pop(key, None)
+        if old is not None:
+            self.nbytes -= entry_bytes(key, old)
+        self.records[key] = value
+        self.nbytes += entry_bytes(key, value)
+        self.peak_entries = max(self.peak_entries, len(self.records))
+        # Evict the least recently used records until the memo fits again
+        while self.max_bytes is not None and self.nbytes > self.max_bytes:
+            k, v = self.records.popitem(last=False)
+            self.nbytes -= entry_bytes(k, v)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def stats(self) -> dict[str, int]:
+        """Hits, misses, evictions, peak entries and bytes of the memo"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "peak_entries": self.peak_entries,
+            "bytes": self.nbytes,
+        }
+
+
+def entry_bytes(key: int, value: int) -> int:
+    """Approximate bytes of one sparse record"""
+    return sys.getsizeof(key) + sys.getsizeof(value) + ENTRY_OVERHEAD
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    from memo_search import edit_distance_dfs_mem_iter, knapsack_dfs_mem_iter
+
+    # Knapsack with large weights reaches only a small fraction of the states
+    wgt = [1000, 2000, 3000, 4000, 5000, 7000, 11000, 13000]
+    val = [50, 120, 150, 210, 240, 300, 500, 600]
+    cap = 20000
+    n = len(wgt)
+    print(f"0-1 knapsack, {n} items, capacity {cap}")
+    for name, mem in [
+        ("dense", DenseMemo((n + 1) * (cap + 1))),
+        ("sparse", LRUMemo()),
+        ("lru 4 KiB", LRUMemo(max_bytes=4 * 1024)),
+    ]:
+        res = knapsack_dfs_mem_iter(wgt, val, cap, mem)
+        print(f"{name:>10}: value = {res}, {mem.stats()}")
+
+    # Edit distance reaches most of the states; an LRU cap well below the
+    # search frontier makes evicted states be solved again and again
+    s, t = "intention" * 4, "execution" * 4
+    n, m = len(s), len(t)
+    print(f"\nEdit distance, strings of length {n} and {m}")
+    for name, mem in [
+        ("dense", DenseMemo((n + 1) * (m + 1))),
+        ("sparse", LRUMemo()),
+        ("lru 40 KiB", LRUMemo(max_bytes=40 * 1024)),
+    ]:
+        res = edit_distance_dfs_mem_iter(s, t, mem)
+        print(f"{name:>10}: distance = {res}, {mem.stats()}")
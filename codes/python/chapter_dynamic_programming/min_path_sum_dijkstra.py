@@ -0,0 +1,140 @@
+"""
+File: min_path_sum_dijkstra.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from array import array
+from math import inf
+from timeit import default_timer as timer
+import heapq
+import random
+
+from min_path_sum import min_path_sum_dp
+
+# Moves allowed from a cell: 2 = right/down, 4 = 4-neighbour, 8 = 8-neighbour
+MOVES = {
+    2: [(0, 1), (1, 0)],
+    4: [(0, 1), (1, 0), (0, -1), (-1, 0)],
+    8: [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)],
+}
+
+
+def min_path_sum_dp_path(grid: list[list[int]]) -> tuple[int, list[tuple[int, int]]]:
+    """Minimum path sum: Dynamic programming, returning the path as well"""
+    n, m = len(grid), len(grid[0])
+    # Initialize dp table
+    dp = [[0] * m for _ in range(n)]
+    dp[0][0] = grid[0][0]
+    # State transition: first row
+    for j in range(1, m):
+        dp[0][j] = dp[0][j - 1] + grid[0][j]
+    # State transition: first column
+    for i in range(1, n):
+        dp[i][0] = dp[i - 1][0] + grid[i][0]
+    # State transition: the rest of the rows and columns
+    for i in range(1, n):
+        for j in range(1, m):
+            dp[i][j] = min(dp[i][j - 1], dp[i - 1][j]) + grid[i][j]
+    # Backtrack from the bottom-right corner, always stepping to the cheaper predecessor
+    path = [(n - 1, m - 1)]
+    i, j = n - 1, m - 1
+    while i > 0 or j > 0:
+        if j == 0 or (i > 0 and dp[i - 1][j] <= dp[i][j - 1]):
+            i -= 1
+        else:
+            j -= 1
+        path.append((i, j))
+    path.reverse()
+    return dp[n - 1][m - 1], path
+
+
+def min_path_sum_dijkstra(
+    grid: list[list[int]], moves: int = 4, astar: bool = False
+) -> tuple[int, list[tuple[int, int]]]:
+    """Minimum path sum: Dijkstra (or A*) over the grid cells, costs must be non-negative"""
+    n, m = len(grid), len(grid[0])
+    steps = MOVES[moves]
+    # Heuristic: every remaining step costs at least the cheapest cell
+    min_cost = min(min(row) for row in grid) if astar else 0
+
+    def h(i: int, j: int) -> int:
+        di, dj = n - 1 - i, m - 1 - j
+        if moves == 8:
+            return min_cost * max(di, dj)
+        return min_cost * (di + dj)
+
+    # Cell (i, j) is stored as i * m + j
+    dist = [inf] * (n * m)
+    prev = array("q", [-1]) * (n * m)
+    dist[0] = grid[0][0]
+    heap = [(dist[0] + h(0, 0), 0)]
+    target = n * m - 1
+    while heap:
+        f, cell = heapq.heappop(heap)
+        if cell == target:
+            break
+        i, j = divmod(cell, m)
+        d = dist[cell]
+        # Skip stale entries of cells that were reached more cheaply later
+        if f > d + h(i, j):
+            continue
+        for di, dj in steps:
+            x, y = i + di, j + dj
+            if 0 <= x < n and 0 <= y < m:
+                nd = d + grid[x][y]
+                nxt = x * m + y
+                if nd < dist[nxt]:
+                    dist[nxt] = nd
+                    prev[nxt] = cell
+                    heapq.heappush(heap, (nd + h(x, y), nxt))
+    # Follow the predecessors back from the bottom-right corner
+    path = []
+    cell = target
+    while cell != -1:
+        path.append(divmod(cell, m))
+        cell = prev[cell]
+    path.reverse()
+    return dist[target], path
+
+
+def min_cost_path(
+    grid: list[list[int]], moves: int = 2, astar: bool = False
+) -> tuple[int, list[tuple[int, int]]]:
+    """Minimum cost path from the top-left to the bottom-right corner, as (cost, path)"""
+    # Right/down moves form a DAG, so the O(n*m) dynamic programming suffices
+    if moves == 2:
+        return min_path_sum_dp_path(grid)
+    return min_path_sum_dijkstra(grid, moves, astar)
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    grid = [[1, 3, 1, 5], [2, 2, 4, 2], [5, 3, 2, 1], [4, 3, 5, 2]]
+    for moves in [2, 4, 8]:
+        cost, path = min_cost_path(grid, moves)
+        print(f"{moves} moves: the minimum path sum is {cost}, the path is {path}")
+
+    # Benchmark: dynamic programming vs Dijkstra vs A* on a large grid
+    random.seed(0)
+    n = m = 300
+    grid = [[random.randint(1, 9) for _ in range(m)] for _ in range(n)]
+    expected = min_path_sum_dp(grid)
+    print(f"\nA {n} x {m} grid")
+    for name, func, args in [
+        ("dp (right/down)", min_path_sum_dp_path, ()),
+        ("dijkstra (right/down)", min_path_sum_dijkstra, (2,)),
+        ("dijkstra (4 moves)", min_path_sum_dijkstra, (4,)),
+        ("a* (4 moves)", min_path_sum_dijkstra, (4, True)),
+        ("dijkstra (8 moves)", min_path_sum_dijkstra, (8,)),
+        ("a* (8 moves)", min_path_sum_dijkstra, (8, True)),
+    ]:
+        start = timer()
+        cost, path = func(grid, *args)
+        elapsed = timer() - start
+        # The path must start and end at the corners and sum up to the cost
+        assert path[0] == (0, 0) and path[-1] == (n - 1, m - 1)
+        assert sum(grid[i][j] for i, j in path) == cost
+        if args[:1] in [(), (2,)]:
+            assert cost == expected
+        print(f"{name:>22}: cost = {cost}, {len(path)} cells, {elapsed:.4f} s")
@@ -0,0 +1,77 @@
+"""
+File: min_path_sum_stream.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from collections.abc import Iterable
+from timeit import default_timer as timer
+import os
+import random
+import tempfile
+
+import numpy as np
+
+from min_path_sum import min_path_sum_dp_comp
+
+
+def min_path_row(dp: np.ndarray | None, row: np.ndarray) -> np.ndarray:
+    """State transition of one row: dp[j] = min(dp[j-1], dp[j]) + row[j], vectorized"""
+    # prefix[j] = row[0] + ... + row[j]
+    prefix = np.cumsum(row, dtype=np.int64)
+    # State transition: first row, only moving right
+    if dp is None:
+        return prefix
+    # Entering the row from above at column k and moving right to column j costs
+    # dp[k] + prefix[j] - prefix[k-1], so dp[j] = prefix[j] + min_{k<=j}(dp[k] - prefix[k-1])
+    shifted = np.empty_like(prefix)
+    shifted[0] = 0
+    shifted[1:] = prefix[:-1]
+    return prefix + np.minimum.accumulate(dp - shifted)
+
+
+def min_path_sum_rows(rows: Iterable) -> int:
+    """Minimum path sum: Space-optimized dynamic programming over a stream of rows"""
+    dp = None
+    # Only one dp row is kept, each grid row is read once and then dropped
+    for row in rows:
+        dp = min_path_row(dp, np.asarray(row))
+    return int(dp[-1])
+
+
+def min_path_sum_memmap(path: str, n: int, m: int, dtype=np.int32) -> int:
+    """Minimum path sum of an n x m grid stored as a raw binary file, read row by row"""
+    grid = np.memmap(path, dtype=dtype, mode="r", shape=(n, m))
+    return min_path_sum_rows(grid)
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    grid = [[1, 3, 1, 5], [2, 2, 4, 2], [5, 3, 2, 1], [4, 3, 5, 2]]
+
+    # Stream of rows
+    res = min_path_sum_rows(iter(grid))
+    print(f"The minimum path sum from the top-left to the bottom-right corner is {res}")
+
+    # Cross-check against the scalar version on random grids
+    random.seed(0)
+    for _ in range(100):
+        n, m = random.randint(1, 8), random.randint(1, 8)
+        grid = [[random.randint(0, 9) for _ in range(m)] for _ in range(n)]
+        assert min_path_sum_rows(grid) == min_path_sum_dp_comp(grid)
+
+    # Memory-mapped int32 grid on disk
+    n, m = 1000, 1000
+    grid = np.random.default_rng(0).integers(0, 100, size=(n, m), dtype=np.int32)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grid.bin")
+        grid.tofile(path)
+        start = timer()
+        expected = min_path_sum_dp_comp(grid.tolist())
+        t_py = timer() - start
+        start = timer()
+        res = min_path_sum_memmap(path, n, m)
+        t_np = timer() - start
+    assert res == expected
+    print(f"\nA {n} x {m} grid on disk, the minimum path sum is {res}")
+    print(f"min_path_sum_dp_comp: {t_py:.4f} s, min_path_sum_memmap: {t_np:.4f} s")
@@ -0,0 +1,217 @@
+"""
+File: unbounded_knapsack_residue.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from itertools import accumulate
+from timeit import default_timer as timer
+import random
+
+import numpy as np
+
+from coin_change import coin_change_dp_comp
+from coin_change_ii import coin_change_ii_dp_comp
+from unbounded_knapsack import unbounded_knapsack_dp_comp
+
+# In the complete knapsack, dp[c] depends on dp[c - w] of the same row, so the row
+# cannot be updated with one shifted array operation. Splitting the capacities into
+# residue classes modulo w turns each class x[k] = dp[r + k * w] into a running
+# maximum (or minimum, or sum) over k, which can be computed with a scan:
+#   max over j <= k of (x[j] + (k - j) * v) = k * v + max over j <= k of (x[j] - j * v)
+
+
+def residue_classes(dp: np.ndarray, w: int) -> np.ndarray:
+    """View dp (padded to a multiple of w) as a table whose column r is the residue class r mod w"""
+    k = -(-len(dp) // w)
+    table = np.empty(k * w, dtype=dp.dtype)
+    table[: len(dp)] = dp
+    # Padding sits after the last capacity, so it never flows into real cells
+    table[len(dp) :] = dp[-1]
+    return table.reshape(k, w)
+
+
+def unbounded_knapsack_np(wgt: list[int], val: list[int], cap: int) -> int:
+    """Complete knapsack: Residue-class scans with NumPy"""
+    dp = np.zeros(cap + 1, dtype=np.int64)
+    for w, v in zip(wgt, val):
+        if w > cap:
+            continue
+        table = residue_classes(dp, w)
+        kv = np.arange(table.shape[0], dtype=np.int64)[:, None] * v
+        table = np.maximum.accumulate(table - kv, axis=0) + kv
+        dp = table.ravel()[: cap + 1]
+    return int(dp[cap])
+
+
+def coin_change_np(coins: list[int], amt: int) -> int:
+    """Coin change: Residue-class scans with NumPy"""
+    MAX = amt + 1
+    dp = np.full(amt + 1, MAX, dtype=np.int64)
+    dp[0] = 0
+    for c in coins:
+        if c > amt:
+            continue
+        table = residue_classes(dp, c)
+        k = np.arange(table.shape[0], dtype=np.int64)[:, None]
+        table = np.minimum.accumulate(table - k, axis=0) + k
+        dp = table.ravel()[: amt + 1]
+    return int(dp[amt]) if dp[amt] != MAX else -1
+
+
+def coin_change_ii_np(coins: list[int], amt: int, mod: int | None = None) -> int:
+    """Coin change II: Residue-class prefix sums with NumPy, counted modulo mod if given"""
+    # Residues below 2^62 fit the int64 path, larger moduli reduce the exact count
+    if mod and mod <= 2**62:
+        return coin_change_ii_np_mod(coins, amt, mod)
+    # The exact counts outgrow int64, so keep Python integers in an object array
+    dp = np.zeros(amt + 1, dtype=object)
+    dp[0] = 1
+    for c in coins:
+        if c > amt:
+            continue
+        table = residue_classes(dp, c)
+        dp = np.cumsum(table, axis=0).ravel()[: amt + 1]
+    return int(dp[amt]) % mod if mod else int(dp[amt])
+
+
+def coin_change_ii_np_mod(coins: list[int], amt: int, mod: int) -> int:
+    """Coin change II modulo mod <= 2^62: Residue-class prefix sums on an int64 array"""
+    if not 0 < mod <= 2**62:
+        raise ValueError("mod must be in 1..2^62 for int64 counts")
+    # Counts are kept below mod, so block rows plus a carried row sum to at most
+    # (block + 1) * (mod - 1), which stays below 2^63. With block clamped to 1 this
+    # needs 2 * (mod - 1) < 2^63, hence mod <= 2^62
+    block = max((2**63 - 1) // mod - 1, 1)
+    dp = np.zeros(amt + 1, dtype=np.int64)
+    dp[0] = 1 % mod
+    for c in coins:
+        if c > amt:
+            continue
+        table = residue_classes(dp, c)
+        carry = np.zeros(c, dtype=np.int64)
+        for lo in range(0, table.shape[0], block):
+            part = np.cumsum(table[lo : lo + block], axis=0)
+            part += carry
+            part %= mod
+            table[lo : lo + block] = part
+            carry = part[-1]
+        dp = table.ravel()[: amt + 1]
+    return int(dp[amt])
+
+
+def coin_change_ii_residue(coins: list[int], amt: int) -> int:
+    """Coin change II: Residue-class prefix sums with itertools, no NumPy"""
+    # The prefix sums run inside accumulate without a Python call per cell. The same
+    # scan for the knapsack and coin change would call max / min once per cell,
+    # which is no faster than the loops of the *_dp_comp versions
+    dp = [0] * (amt + 1)
+    dp[0] = 1
+    for c in coins:
+        if c > amt:
+            continue
+        for r in range(c):
+            dp[r::c] = list(accumulate(dp[r::c]))
+    return dp[amt]
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    wgt = [1, 2, 3]
+    val = [5, 11, 15]
+    cap = 4
+    res = unbounded_knapsack_np(wgt, val, cap)
+    print(f"The maximum item value without exceeding knapsack capacity is {res}")
+
+    coins = [1, 2, 5]
+    res = coin_change_np(coins, 4)
+    print(f"Minimum number of coins required to reach the target amount = {res}")
+    res = coin_change_ii_np(coins, 5)
+    print(f"The number of coin combinations to make up the target amount is {res}")
+    res = coin_change_ii_residue(coins, 5)
+    print(f"The number of coin combinations to make up the target amount is {res}")
+
+    # Correctness suite against the scalar versions on random inputs
+    random.seed(0)
+    for _ in range(300):
+        n = random.randint(1, 5)
+        cap = random.randint(0, 60)
+        wgt = [random.randint(1, 25) for _ in range(n)]
+        val = [random.randint(0, 30) for _ in range(n)]
+        expected = unbounded_knapsack_dp_comp(wgt, val, cap)
+        assert unbounded_knapsack_np(wgt, val, cap) == expected, (wgt, val, cap)
+        expected = coin_change_dp_comp(wgt, cap)
+        assert coin_change_np(wgt, cap) == expected, (wgt, cap)
+        expected = coin_change_ii_dp_comp(wgt, cap)
+        assert coin_change_ii_np(wgt, cap) == expected, (wgt, cap)
+        assert coin_change_ii_residue(wgt, cap) == expected, (wgt, cap)
+        for mod in [7, 1_000_000_007, 2**62 + 135]:
+            assert coin_change_ii_np(wgt, cap, mod) == expected % mod, (wgt, cap, mod)
+            assert coin_change_ii_dp_comp(wgt, cap, mod) == expected % mod
+    # Large counts with moduli beyond the int64 path: 2^62 itself, just below 2^63, above 2^64
+    coins = list(range(1, 41))
+    expected = coin_change_ii_dp_comp(coins, 3000)
+    for mod in [2**62, 2**63 - 25, 2**64 + 13]:
+        assert coin_change_ii_np(coins, 3000, mod) == expected % mod, mod
+        assert coin_change_ii_dp_comp(coins, 3000, mod) == expected % mod, mod
+    print("\nAll residue-class versions agree with the scalar versions")
+
+    # Benchmark: scalar vs NumPy (vs itertools for coin change II)
+    n, cap = 20, 50000
+    wgt = [random.randint(1, 500) for _ in range(n)]
+    val = [random.randint(1, 1000) for _ in range(n)]
+    print(f"\nn = {n}, cap = {cap}")
+    for name, funcs, args in [
+        (
+            "unbounded_knapsack",
+            {"scalar": unbounded_knapsack_dp_comp, "numpy": unbounded_knapsack_np},
+            (wgt, val, cap),
+        ),
+        (
+            "coin_change",
+            {"scalar": coin_change_dp_comp, "numpy": coin_change_np},
+            (wgt, cap),
+        ),
+        (
+            "coin_change_ii",
+            {
+                "scalar": coin_change_ii_dp_comp,
+                "numpy": coin_change_ii_np,
+                "itertools": coin_change_ii_residue,
+            },
+            (wgt, cap),
+        ),
+    ]:
+        times = {}
+        results = set()
+        for label, func in funcs.items():
+            start = timer()
+            results.add(func(*args))
+            times[label] = timer() - start
+        assert len(results) == 1
+        print(f"{name:>18}: " + ", ".join(f"{k} {t:.4f} s" for k, t in times.items()))
+
+    # Benchmark: exact big-integer counts vs counts modulo a prime
+    # With coins 1..40 the counts grow to thousands of bits
+    coins = list(range(1, 41))
+    mod = 1_000_000_007
+    print(f"\ncoin_change_ii, coins = 1..{len(coins)}, mod = {mod}")
+    print(f"{'amt':>8} {'exact dp':>10} {'mod dp':>10} {'exact np':>10} {'mod np':>10}")
+    crossover = None
+    for amt in [100, 300, 1000, 5000, 20000]:
+        times = []
+        results = []
+        for func, args in [
+            (coin_change_ii_dp_comp, (coins, amt)),
+            (coin_change_ii_dp_comp, (coins, amt, mod)),
+            (coin_change_ii_np, (coins, amt)),
+            (coin_change_ii_np, (coins, amt, mod)),
+        ]:
+            start = timer()
+            results.append(func(*args))
+            times.append(timer() - start)
+        assert results[0] % mod == results[1] == results[3] and results[0] == results[2]
+        print(f"{amt:>8} " + " ".join(f"{t:>10.4f}" for t in times))
+        if crossover is None and times[3] < min(times[0], times[2]):
+            crossover = amt
+    print(f"The int64 modular path is faster than both exact paths from amt = {crossover}")
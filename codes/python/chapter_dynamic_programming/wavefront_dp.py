@@ -0,0 +1,282 @@
+"""
+File: wavefront_dp.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from timeit import default_timer as timer
+import random
+
+import numpy as np
+
+from edit_distance import edit_distance_dp, edit_distance_dp_comp
+from min_path_sum import min_path_sum_dp, min_path_sum_dp_comp
+
+# Every cell (i, j) of edit_distance_dp and min_path_sum_dp only depends on cells with a
+# smaller i + j, so all cells on one anti-diagonal d = i + j are independent of each other.
+# The same holds for tiles: tile (bi, bj) only depends on the tiles above and to the left,
+# so all tiles with the same bi + bj can be computed in parallel.
+
+# Larger than any path sum, smaller than int64 overflow when a grid value is added
+BIG = 2**62
+
+
+def as_codes(s: str) -> np.ndarray:
+    """Characters of s as an array of code points"""
+    return np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+
+
+def edit_distance_wavefront(s: str, t: str) -> int:
+    """Edit distance: Anti-diagonal wavefront with NumPy, O(n + m) memory"""
+    n, m = len(s), len(t)
+    a, b = as_codes(s), as_codes(t)
+    # prev1[i] and prev2[i] hold dp[i][d - 1 - i] and dp[i][d - 2 - i] of the two
+    # previous anti-diagonals
+    prev2 = np.zeros(n + 1, dtype=np.int64)
+    prev1 = np.zeros(n + 1, dtype=np.int64)
+    prev1[0] = 1 if m >= 1 else 0
+    if n >= 1:
+        prev1[1] = 1
+    if n + m <= 1:
+        return n + m
+    for d in range(2, n + m + 1):
+        cur = np.zeros(n + 1, dtype=np.int64)
+        # State transition: first row and first column
+        if d <= m:
+            cur[0] = d
+        if d <= n:
+            cur[d] = d
+        # State transition: interior cells of the anti-diagonal, all at once
+        lo, hi = max(1, d - m), min(n, d - 1)
+        if lo <= hi:
+            i = np.arange(lo, hi + 1)
+            j = d - i
+            cost = (a[i - 1] != b[j - 1]).astype(np.int64)
+            # Insert (left), delete (up) and replace or skip (left-up)
+            cur[lo : hi + 1] = np.minimum(
+                np.minimum(prev1[i], prev1[i - 1]) + 1, prev2[i - 1] + cost
+            )
+        prev2, prev1 = prev1, cur
+    return int(prev1[n])
+
+
+def min_path_sum_wavefront(grid: list[list[int]]) -> int:
+    """Minimum path sum: Anti-diagonal wavefront with NumPy, O(n + m) memory"""
+    g = np.asarray(grid, dtype=np.int64)
+    n, m = g.shape
+    # prev[i] holds dp[i][d - 1 - i] of the previous anti-diagonal, indexed by i
+    prev = np.full(n, BIG, dtype=np.int64)
+    prev[0] = g[0, 0]
+    for d in range(1, n + m - 1):
+        cur = np.full(n, BIG, dtype=np.int64)
+        lo, hi = max(0, d - m + 1), min(n - 1, d)
+        i = np.arange(lo, hi + 1)
+        j = d - i
+        # From the cell above (i - 1, j) or the cell to the left (i, j - 1)
+        up = np.where(i > 0, prev[np.maximum(i - 1, 0)], BIG)
+        left = np.where(j > 0, prev[i], BIG)
+        cur[lo : hi + 1] = np.minimum(up, left) + g[i, j]
+        prev = cur
+    return int(prev[n - 1])
+
+
+# State of a tile worker process, set once by init_tile_worker
+worker: dict = {}
+
+# The tiled versions keep only tile boundaries in shared memory: hrows[bi] is the dp
+# row just above tile row bi (over all columns, with the column left of the table
+# at index 0), vcols[bj] is the dp column just left of tile column bj (over all
+# rows). A tile reads its top boundary from hrows[bi] and its left boundary from
+# vcols[bj], keeps its own rows in private memory, and writes its last row to
+# hrows[bi + 1] and its last column to vcols[bj + 1]. For n x m tables and tiles of
+# t x t cells this is about 2 * n * m / t values instead of n * m.
+
+
+def init_tile_worker(name: str, hshape: tuple[int, int], vshape: tuple[int, int], *data):
+    """Process pool initializer: attach the shared boundaries, keep the small inputs"""
+    shm = shared_memory.SharedMemory(name=name)
+    worker["shm"] = shm
+    size = hshape[0] * hshape[1]
+    worker["hrows"] = np.ndarray(hshape, dtype=np.int64, buffer=shm.buf)
+    worker["vcols"] = np.ndarray(vshape, dtype=np.int64, buffer=shm.buf, offset=8 * size)
+    worker["data"] = data
+
+
+def edit_distance_tile(bi: int, bj: int, i0: int, i1: int, j0: int, j1: int):
+    """Fill rows i0..i1-1, columns j0..j1-1 of the edit distance table from its boundaries"""
+    hrows, vcols = worker["hrows"], worker["vcols"]
+    a, b = worker["data"]
+    k = np.arange(j1 - j0 + 1)
+    # prev[0] is the corner dp[i - 1][j0 - 1], prev[1:] the row above the tile
+    prev = hrows[bi, j0 - 1 : j1].copy()
+    last_col = np.empty(i1 - i0, dtype=np.int64)
+    for i in range(i0, i1):
+        # Candidates from the row above: delete (up) and replace or skip (left-up)
+        cost = (b[j0 - 1 : j1 - 1] != a[i - 1]).astype(np.int64)
+        c = np.minimum(prev[1:] + 1, prev[:-1] + cost)
+        # Inserting from the left is a running minimum: dp[i][j] = min over k <= j of
+        # (c[k] + j - k), starting from the cell left of the tile
+        row = np.concatenate(([vcols[bj, i]], c))
+        prev = np.minimum.accumulate(row - k) + k
+        last_col[i - i0] = prev[-1]
+    hrows[bi + 1, j0:j1] = prev[1:]
+    vcols[bj + 1, i0:i1] = last_col
+
+
+def min_path_sum_tile(bi: int, bj: int, i0: int, i1: int, j0: int, j1: int):
+    """Fill rows i0..i1-1, columns j0..j1-1 of the min path sum table from its boundaries"""
+    hrows, vcols = worker["hrows"], worker["vcols"]
+    (g,) = worker["data"]
+    # Column j of the table is column j + 1 of hrows
+    up = hrows[bi, j0 + 1 : j1 + 1].copy()
+    last_col = np.empty(i1 - i0, dtype=np.int64)
+    for i in range(i0, i1):
+        prefix = np.cumsum(g[i, j0:j1])
+        shifted = np.concatenate(([0], prefix[:-1]))
+        # Entering from above at column k: dp[i-1][k] - prefix[k-1] + prefix[j]
+        cand = up - shifted
+        # The path starts at the top-left cell
+        if i == 0 and j0 == 0:
+            cand[0] = 0
+        best = np.minimum.accumulate(cand)
+        # Entering from the cell left of the tile
+        if j0 > 0:
+            best = np.minimum(best, vcols[bj, i])
+        up = np.minimum(prefix + best, BIG)
+        last_col[i - i0] = up[-1]
+    hrows[bi + 1, j0 + 1 : j1 + 1] = up
+    vcols[bj + 1, i0:i1] = last_col
+
+
+def blocks(r: range, tile: int) -> list[tuple[int, int]]:
+    """Split r into consecutive (start, stop) blocks of at most tile"""
+    return [(i, min(i + tile, r.stop)) for i in range(r.start, r.stop, tile)]
+
+
+def run_tiles(row_blocks: list, col_blocks: list, task, workers: int | None, initargs: tuple):
+    """Run task over all tiles, one tile anti-diagonal at a time"""
+    nb, mb = len(row_blocks), len(col_blocks)
+    with ProcessPoolExecutor(
+        workers, initializer=init_tile_worker, initargs=initargs
+    ) as pool:
+        for d in range(nb + mb - 1):
+            # Tiles on the same anti-diagonal are independent, run them in parallel
+            futures = [
+                pool.submit(task, bi, d - bi, *row_blocks[bi], *col_blocks[d - bi])
+                for bi in range(max(0, d - mb + 1), min(nb, d + 1))
+            ]
+            # Wait for the whole tile anti-diagonal before starting the next one
+            for f in wait(futures).done:
+                f.result()
+
+
+def edit_distance_tiled(
+    s: str, t: str, tile: int = 1024, workers: int | None = None
+) -> int:
+    """Edit distance: Tiled wavefront on a process pool, tile boundaries in shared memory"""
+    n, m = len(s), len(t)
+    if not n or not m:
+        return n + m
+    row_blocks, col_blocks = blocks(range(1, n + 1), tile), blocks(range(1, m + 1), tile)
+    hshape, vshape = (len(row_blocks) + 1, m + 1), (len(col_blocks) + 1, n + 1)
+    hsize, vsize = hshape[0] * hshape[1], vshape[0] * vshape[1]
+    shm = shared_memory.SharedMemory(create=True, size=8 * (hsize + vsize))
+    try:
+        hrows = np.ndarray(hshape, dtype=np.int64, buffer=shm.buf)
+        vcols = np.ndarray(vshape, dtype=np.int64, buffer=shm.buf, offset=8 * hsize)
+        # State transition: first row and first column, dp[i][0] = i and dp[0][j] = j
+        hrows[0] = np.arange(m + 1)
+        vcols[0] = np.arange(n + 1)
+        for bi, (_, i1) in enumerate(row_blocks):
+            hrows[bi + 1, 0] = i1 - 1
+        initargs = (shm.name, hshape, vshape, as_codes(s), as_codes(t))
+        run_tiles(row_blocks, col_blocks, edit_distance_tile, workers, initargs)
+        res = int(hrows[-1, m])
+        del hrows, vcols
+    finally:
+        shm.close()
+        shm.unlink()
+    return res
+
+
+def min_path_sum_tiled(
+    grid: list[list[int]], tile: int = 1024, workers: int | None = None
+) -> int:
+    """Minimum path sum: Tiled wavefront on a process pool, tile boundaries in shared memory"""
+    g = np.asarray(grid, dtype=np.int64)
+    n, m = g.shape
+    row_blocks, col_blocks = blocks(range(n), tile), blocks(range(m), tile)
+    hshape, vshape = (len(row_blocks) + 1, m + 1), (len(col_blocks) + 1, n)
+    hsize, vsize = hshape[0] * hshape[1], vshape[0] * vshape[1]
+    shm = shared_memory.SharedMemory(create=True, size=8 * (hsize + vsize))
+    try:
+        hrows = np.ndarray(hshape, dtype=np.int64, buffer=shm.buf)
+        vcols = np.ndarray(vshape, dtype=np.int64, buffer=shm.buf, offset=8 * hsize)
+        # Cells outside the table cost +∞
+        hrows[:] = BIG
+        vcols[:] = BIG
+        # Like the strings of edit_distance_tiled, the grid is handed to each worker once
+        # (inherited without a copy where processes are forked), not kept in shared memory
+        initargs = (shm.name, hshape, vshape, g)
+        run_tiles(row_blocks, col_blocks, min_path_sum_tile, workers, initargs)
+        res = int(hrows[-1, m])
+        del hrows, vcols
+    finally:
+        shm.close()
+        shm.unlink()
+    return res
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    s, t = "bag", "pack"
+    res = edit_distance_wavefront(s, t)
+    print(f"To change {s} to {t}, the minimum number of edits required is {res}")
+    res = edit_distance_tiled(s, t, tile=2, workers=2)
+    print(f"To change {s} to {t}, the minimum number of edits required is {res}")
+
+    grid = [[1, 3, 1, 5], [2, 2, 4, 2], [5, 3, 2, 1], [4, 3, 5, 2]]
+    res = min_path_sum_wavefront(grid)
+    print(f"The minimum path sum from the top-left to the bottom-right corner is {res}")
+    res = min_path_sum_tiled(grid, tile=2, workers=2)
+    print(f"The minimum path sum from the top-left to the bottom-right corner is {res}")
+
+    # Cross-check against the row-by-row versions on random inputs
+    random.seed(0)
+    for _ in range(10):
+        s = "".join(random.choice("abc") for _ in range(random.randint(0, 12)))
+        t = "".join(random.choice("abc") for _ in range(random.randint(0, 12)))
+        expected = edit_distance_dp(s, t)
+        assert edit_distance_wavefront(s, t) == expected, (s, t)
+        assert edit_distance_tiled(s, t, tile=3, workers=2) == expected, (s, t)
+        n, m = random.randint(1, 9), random.randint(1, 9)
+        grid = [[random.randint(0, 9) for _ in range(m)] for _ in range(n)]
+        expected = min_path_sum_dp(grid)
+        assert min_path_sum_wavefront(grid) == expected, grid
+        assert min_path_sum_tiled(grid, tile=3, workers=2) == expected, grid
+
+    # Benchmark: row by row vs anti-diagonal wavefront vs tiled process pool.
+    # A tile fills whole rows with contiguous NumPy operations, which beats the
+    # fancy indexing of the wavefront even on one core once tables are large
+    for n in [1500, 4000]:
+        s = "".join(random.choice("acgt") for _ in range(n))
+        t = "".join(random.choice("acgt") for _ in range(n))
+        grid = np.random.default_rng(n).integers(0, 100, (n, n))
+        print(f"\nTables of {n} x {n}")
+        funcs = [
+            ("edit_distance_wavefront", edit_distance_wavefront, (s, t)),
+            ("edit_distance_tiled", edit_distance_tiled, (s, t, 2048)),
+            ("min_path_sum_wavefront", min_path_sum_wavefront, (grid,)),
+            ("min_path_sum_tiled", min_path_sum_tiled, (grid, 2048)),
+        ]
+        if n <= 1500:
+            funcs += [
+                ("edit_distance_dp_comp", edit_distance_dp_comp, (s, t)),
+                ("min_path_sum_dp_comp", min_path_sum_dp_comp, (grid.tolist(),)),
+            ]
+        for name, func, args in funcs:
+            start = timer()
+            res = func(*args)
+            print(f"{name:>24}: {res} ({timer() - start:.4f} s)")
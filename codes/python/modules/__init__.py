@@ -10,10 +10,21 @@ from .list_node import (
 )
 from .tree_node import TreeNode, list_to_tree, tree_to_list
 from .vertex import Vertex, vals_to_vets, vets_to_vals
+from .arena import (
+    LinkedListArena,
+    TreeArena,
+    ArenaListNode,
+    ArenaTreeNode,
+    list_to_linked_list_arena,
+    list_to_tree_arena,
+)
+from .heap import Heap
+from .serialize import dump_linked_list, load_linked_list, dump_tree, load_tree
 from .print_util import (
     print_matrix,
     print_linked_list,
     print_tree,
+    print_tree_dfs,
     print_dict,
     print_heap,
 )
@@ -0,0 +1,201 @@
+"""
+File: arena.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from array import array
+
+# Nodes of an arena are rows of parallel int64 arrays, links are row indices and
+# NIL stands for None. A node costs 16 (list) or 32 (tree) bytes instead of a
+# Python object per node. ArenaListNode and ArenaTreeNode are small views that
+# expose the same .val / .next / .left / .right attributes as ListNode and TreeNode,
+# so code written for those classes can traverse an arena unchanged.
+NIL = -1
+
+
+class LinkedListArena:
+    """Linked list nodes stored as parallel val / next arrays"""
+
+    def __init__(self):
+        self.val = array("q")
+        self.next = array("q")
+
+    def __len__(self) -> int:
+        return len(self.val)
+
+    def new_node(self, val: int) -> int:
+        """Append a node without successor, return its index"""
+        self.val.append(val)
+        self.next.append(NIL)
+        return len(self.val) - 1
+
+    def node(self, i: int) -> "ArenaListNode | None":
+        """View of node i, None for NIL"""
+        return None if i == NIL else ArenaListNode(self, i)
+
+    @classmethod
+    def from_list(cls, arr: list[int]) -> "LinkedListArena":
+        """Build the chain arr[0] -> arr[1] -> ... with the head at index 0"""
+        arena = cls()
+        arena.val = array("q", arr)
+        arena.next = array("q", range(1, len(arr) + 1))
+        if arr:
+            arena.next[-1] = NIL
+        return arena
+
+
+class ArenaListNode:
+    """View of one node of a LinkedListArena, used like a ListNode"""
+
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: LinkedListArena, index: int):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def val(self) -> int:
+        return self.arena.val[self.index]
+
+    @val.setter
+    def val(self, val: int):
+        self.arena.val[self.index] = val
+
+    @property
+    def next(self) -> "ArenaListNode | None":
+        return self.arena.node(self.arena.next[self.index])
+
+    @next.setter
+    def next(self, node: "ArenaListNode | None"):
+        self.arena.next[self.index] = NIL if node is None else node.index
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, ArenaListNode)
+            and self.arena is other.arena
+            and self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self) -> str:
+        return f"ArenaListNode({self.val})"
+
+
+class TreeArena:
+    """Binary tree nodes stored as parallel val / left / right / height arrays"""
+
+    def __init__(self):
+        self.val = array("q")
+        self.left = array("q")
+        self.right = array("q")
+        self.height = array("q")
+
+    def __len__(self) -> int:
+        return len(self.val)
+
+    def new_node(self, val: int = 0) -> int:
+        """Append a leaf node, return its index"""
+        self.val.append(val)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.height.append(0)
+        return len(self.val) - 1
+
+    def node(self, i: int) -> "ArenaTreeNode | None":
+        """View of node i, None for NIL"""
+        return None if i == NIL else ArenaTreeNode(self, i)
+
+    @classmethod
+    def from_list(cls, arr: list[int | None]) -> "TreeArena":
+        """Build a tree from its array representation, with the root at index 0"""
+        arena = cls()
+        n = len(arr)
+        # Arena index of every non-None position of arr
+        index = array("q", [NIL]) * n
+        count = 0
+        for i, v in enumerate(arr):
+            if v is not None:
+                index[i] = count
+                count += 1
+        arena.val = array("q", (v for v in arr if v is not None))
+        arena.left = array("q", [NIL]) * count
+        arena.right = array("q", [NIL]) * count
+        for i, v in enumerate(arr):
+            if v is None:
+                continue
+            # Children of position i are at positions 2i + 1 and 2i + 2
+            if 2 * i + 1 < n:
+                arena.left[index[i]] = index[2 * i + 1]
+            if 2 * i + 2 < n:
+                arena.right[index[i]] = index[2 * i + 2]
+        arena.height = array("q", [0]) * count
+        return arena
+
+
+class ArenaTreeNode:
+    """View of one node of a TreeArena, used like a TreeNode"""
+
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: TreeArena, index: int):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def val(self) -> int:
+        return self.arena.val[self.index]
+
+    @val.setter
+    def val(self, val: int):
+        self.arena.val[self.index] = val
+
+    @property
+    def height(self) -> int:
+        return self.arena.height[self.index]
+
+    @height.setter
+    def height(self, height: int):
+        self.arena.height[self.index] = height
+
+    @property
+    def left(self) -> "ArenaTreeNode | None":
+        return self.arena.node(self.arena.left[self.index])
+
+    @left.setter
+    def left(self, node: "ArenaTreeNode | None"):
+        self.arena.left[self.index] = NIL if node is None else node.index
+
+    @property
+    def right(self) -> "ArenaTreeNode | None":
+        return self.arena.node(self.arena.right[self.index])
+
+    @right.setter
+    def right(self, node: "ArenaTreeNode | None"):
+        self.arena.right[self.index] = NIL if node is None else node.index
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, ArenaTreeNode)
+            and self.arena is other.arena
+            and self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self) -> str:
+        return f"ArenaTreeNode({self.val})"
+
+
+def list_to_linked_list_arena(arr: list[int]) -> ArenaListNode | None:
+    """Deserialize a list into a linked list stored in a LinkedListArena"""
+    return LinkedListArena.from_list(arr).node(0 if arr else NIL)
+
+
+def list_to_tree_arena(arr: list[int | None]) -> ArenaTreeNode | None:
+    """Deserialize a list into a binary tree stored in a TreeArena"""
+    arena = TreeArena.from_list(arr)
+    return arena.node(0 if arr and arr[0] is not None else NIL)
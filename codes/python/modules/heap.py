@@ -0,0 +1,135 @@
+"""
+File: heap.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from typing import Hashable, Iterable
+
+
+class Heap:
+    """Min-heap with d children per node, stored as parallel arrays"""
+
+    # Node i has its children at d * i + 1 .. d * i + d and its parent at (i - 1) // d.
+    # prio[i] and items[i] are the priority and item of node i, and pos maps every
+    # item to its node, so the priority of any item can be decreased in O(log n).
+    # Items must be distinct and hashable.
+
+    def __init__(self, entries: Iterable[tuple[int, Hashable]] = (), d: int = 2):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self.prio: list[int] = []
+        self.items: list[Hashable] = []
+        self.pos: dict[Hashable, int] = {}
+        for p, item in entries:
+            if item in self.pos:
+                raise ValueError(f"item {item!r} is already in the heap")
+            self.pos[item] = len(self.items)
+            self.prio.append(p)
+            self.items.append(item)
+        self.heapify()
+
+    def __len__(self) -> int:
+        return len(self.prio)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.pos
+
+    def heapify(self):
+        """Restore the heap property bottom-up in O(n)"""
+        # Sift down every node that has children, the last one first
+        for i in range((len(self.prio) - 2) // self.d, -1, -1):
+            self.sift_down(i)
+
+    def sift_up(self, i: int):
+        """Move node i up while its priority is smaller than its parent's"""
+        prio, items, pos, d = self.prio, self.items, self.pos, self.d
+        p, item = prio[i], items[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if not p < prio[parent]:
+                break
+            # Move the parent down into the hole
+            prio[i] = prio[parent]
+            items[i] = items[parent]
+            pos[items[i]] = i
+            i = parent
+        prio[i] = p
+        items[i] = item
+        pos[item] = i
+
+    def sift_down(self, i: int):
+        """Move node i down while a child has a smaller priority"""
+        prio, items, pos, d = self.prio, self.items, self.pos, self.d
+        n = len(prio)
+        p, item = prio[i], items[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            # The child with the smallest priority
+            c = first
+            for j in range(first + 1, min(first + d, n)):
+                if prio[j] < prio[c]:
+                    c = j
+            if not prio[c] < p:
+                break
+            # Move the child up into the hole
+            prio[i] = prio[c]
+            items[i] = items[c]
+            pos[items[i]] = i
+            i = c
+        prio[i] = p
+        items[i] = item
+        pos[item] = i
+
+    def peek(self) -> tuple[int, Hashable]:
+        """Entry with the smallest priority"""
+        if not self.prio:
+            raise IndexError("peek from an empty heap")
+        return self.prio[0], self.items[0]
+
+    def push(self, p: int, item: Hashable):
+        """Add item with priority p"""
+        if item in self.pos:
+            raise ValueError(f"item {item!r} is already in the heap")
+        self.prio.append(p)
+        self.items.append(item)
+        self.sift_up(len(self.prio) - 1)
+
+    def pop(self) -> tuple[int, Hashable]:
+        """Remove and return the entry with the smallest priority"""
+        if not self.prio:
+            raise IndexError("pop from an empty heap")
+        top = self.prio[0], self.items[0]
+        del self.pos[top[1]]
+        # Move the last node to the root and sift it down
+        p, item = self.prio.pop(), self.items.pop()
+        if self.prio:
+            self.prio[0] = p
+            self.items[0] = item
+            self.sift_down(0)
+        return top
+
+    def pushpop(self, p: int, item: Hashable) -> tuple[int, Hashable]:
+        """Push item with priority p, then pop the smallest entry, in one sift"""
+        if item in self.pos:
+            raise ValueError(f"item {item!r} is already in the heap")
+        # The new entry would be popped right away
+        if not self.prio or p <= self.prio[0]:
+            return p, item
+        top = self.prio[0], self.items[0]
+        del self.pos[top[1]]
+        self.prio[0] = p
+        self.items[0] = item
+        self.sift_down(0)
+        return top
+
+    def decrease_key(self, item: Hashable, p: int):
+        """Lower the priority of item to p"""
+        i = self.pos[item]
+        if p > self.prio[i]:
+            raise ValueError(f"new priority {p} is greater than {self.prio[i]}")
+        self.prio[i] = p
+        self.sift_up(i)
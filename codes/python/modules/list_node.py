@@ -8,6 +8,8 @@ Author: krahets (krahets@163.com)
 class ListNode:
     """LinkedList node class"""
 
+    __slots__ = ("val", "next")
+
     def __init__(self, val: int):
         self.val: int = val  # Node value
         self.next: ListNode | None = None  # Reference to successor node
@@ -4,16 +4,40 @@ Created Time: 2021-12-11
 Author: krahets (krahets@163.com), msk397 (machangxinq@gmail.com)
 """
 
-from .tree_node import TreeNode, list_to_tree
+from operator import attrgetter
+from typing import Callable, TextIO
+import io
+
+from .tree_node import TreeNode
+from .heap import Heap
 from .list_node import ListNode, linked_list_to_list
 
 
-def print_matrix(mat: list[list[int]]):
-    """Print matrix"""
-    s = []
-    for arr in mat:
-        s.append("  " + str(arr))
-    print("[\n" + ",\n".join(s) + "\n]")
+def print_matrix(
+    mat: list[list[int]],
+    max_rows: int | None = None,
+    max_cols: int | None = None,
+    file: TextIO | None = None,
+):
+    """Print matrix, showing at most max_rows rows and max_cols columns"""
+    buf = io.StringIO()
+    buf.write("[\n")
+    rows = mat if max_rows is None else mat[:max_rows]
+    for i, arr in enumerate(rows):
+        if i:
+            buf.write(",\n")
+        cols = arr if max_cols is None else arr[:max_cols]
+        row = str(cols)
+        if len(cols) < len(arr):
+            # Mark the cut before the closing bracket, keeping the row's own format:
+            # "[1, 2, ...]" for a list, "[1 2 ...]" for a NumPy array
+            sep = ", " if isinstance(arr, (list, tuple)) else " "
+            row = row[:-1] + (sep if len(cols) else "") + "..." + row[-1]
+        buf.write("  " + row)
+    if len(rows) < len(mat):
+        buf.write(f",\n  ... ({len(mat) - len(rows)} more rows)")
+    buf.write("\n]")
+    print(buf.getvalue(), file=file)
 
 
 def print_linked_list(head: ListNode | None):
@@ -35,11 +59,11 @@ def show_trunks(p: Trunk | None):
     print(p.str, end="")
 
 
-def print_tree(
+def print_tree_dfs(
     root: TreeNode | None, prev: Trunk | None = None, is_right: bool = False
 ):
     """
-    Print binary tree
+    Print binary tree: Recursively, one print per fragment
     This tree printer is borrowed from TECHIE DELIGHT
     https://www.techiedelight.com/c-program-print-binary-tree/
     """
@@ -48,7 +72,7 @@ def print_tree(
 
     prev_str = "    "
     trunk = Trunk(prev, prev_str)
-    print_tree(root.right, trunk, True)
+    print_tree_dfs(root.right, trunk, True)
 
     if prev is None:
         trunk.str = "———"
@@ -56,7 +80,7 @@ def print_tree(
         trunk.str = "/———"
         prev_str = "   |"
     else:
-        trunk.str = "\———"
+        trunk.str = "\\———"
         prev.str = prev_str
 
     show_trunks(trunk)
@@ -64,7 +88,95 @@ def print_tree(
     if prev:
         prev.str = prev_str
     trunk.str = "   |"
-    print_tree(root.left, trunk, False)
+    print_tree_dfs(root.left, trunk, False)
+
+
+def render_tree(
+    root,
+    children: Callable = attrgetter("left", "right"),
+    val: Callable = attrgetter("val"),
+    max_nodes: int | None = None,
+    max_depth: int | None = None,
+) -> str:
+    """
+    Render a tree sideways, the last child on top, into a string
+    children(node) returns the children of a node in order, None for a missing one,
+    and val(node) its value. The second half of the children is drawn above the
+    node and the first half below it, so a binary tree has its right subtree on
+    top. Subtrees below max_depth are shown as "...", and rendering stops after
+    max_nodes nodes.
+    """
+    if root is None:
+        return ""
+    buf = io.StringIO()
+    # trunks[d] is the piece of the line prefix drawn for depth d
+    trunks: list[str] = []
+    count = 0
+    # Visit order is upper children, node, lower children; EXIT leaves a node
+    ENTER, VISIT, EXIT = 0, 1, 2
+    # Position of a child: topmost above its parent, between it and its parent,
+    # bottommost below its parent
+    ROOT, TOP, INNER, BOTTOM = 0, 1, 2, 3
+    stack = [(ENTER, root, ROOT)]
+    while stack:
+        action, node, pos = stack.pop()
+        if action == ENTER:
+            trunks.append("    ")
+            if max_depth is not None and len(trunks) > max_depth:
+                # Too deep: draw the subtree as a single "..." line
+                stack.append((EXIT, None, ROOT))
+                stack.append((VISIT, None, pos))
+                continue
+            stack.append((EXIT, None, ROOT))
+            kids = children(node)
+            half = len(kids) // 2
+            # Lower children, the last one drawn closest to the node
+            lower = [c for c in kids[:half] if c is not None]
+            for k, child in enumerate(lower):
+                stack.append((ENTER, child, BOTTOM if k == 0 else INNER))
+            stack.append((VISIT, node, pos))
+            # Upper children, the first one drawn closest to the node
+            upper = [c for c in kids[half:] if c is not None]
+            for k, child in enumerate(upper):
+                stack.append((ENTER, child, TOP if k == len(upper) - 1 else INNER))
+        elif action == VISIT:
+            if max_nodes is not None and count == max_nodes:
+                buf.write(f"... (stopped after {max_nodes} nodes)\n")
+                break
+            d = len(trunks) - 1
+            prev_str = "   |"
+            if pos == ROOT:
+                trunks[d] = "———"
+            elif pos == TOP:
+                trunks[d] = "/———"
+            elif pos == INNER:
+                trunks[d] = "————"
+            else:
+                trunks[d] = "\\———"
+                prev_str = "    "
+                trunks[d - 1] = prev_str
+            buf.write("".join(trunks))
+            buf.write(" ...\n" if node is None else f" {val(node)}\n")
+            count += node is not None
+            if d:
+                trunks[d - 1] = prev_str
+            trunks[d] = "   |"
+        else:
+            trunks.pop()
+    return buf.getvalue()
+
+
+def print_tree(
+    root: TreeNode | None,
+    max_nodes: int | None = None,
+    max_depth: int | None = None,
+    file: TextIO | None = None,
+):
+    """
+    Print binary tree: Iteratively into one buffer, same output as print_tree_dfs
+    Subtrees deeper than max_depth are drawn as "...", output stops after max_nodes
+    """
+    print(render_tree(root, max_nodes=max_nodes, max_depth=max_depth), end="", file=file)
 
 
 def print_dict(hmap: dict):
@@ -73,9 +185,112 @@ def print_dict(hmap: dict):
         print(key, "->", value)
 
 
-def print_heap(heap: list[int]):
+def print_heap(heap: "list[int] | Heap", max_nodes: int | None = None):
     """Print heap"""
+    # A Heap is printed from its priority array
+    d = 2
+    if isinstance(heap, Heap):
+        heap, d = heap.prio, heap.d
     print("Array representation of the heap:", heap)
     print("Tree representation of the heap:")
-    root: TreeNode | None = list_to_tree(heap)
-    print_tree(root)
+    # Render the tree straight from the array, node i has children d * i + 1 .. d * i + d
+    n = len(heap)
+    tree = render_tree(
+        0 if n else None,
+        children=lambda i: [j if j < n else None for j in range(d * i + 1, d * i + d + 1)],
+        val=heap.__getitem__,
+        max_nodes=max_nodes,
+    )
+    print(tree, end="")
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    from contextlib import redirect_stdout
+    import random
+
+    from .tree_node import list_to_tree
+
+    def captured(func, *args, **kwargs) -> str:
+        """Everything func prints"""
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            func(*args, **kwargs)
+        return buf.getvalue()
+
+    # Golden output: the buffered printers match the recursive print_tree_dfs and the
+    # previous str-based print_matrix, and list_to_tree + print_tree for heaps
+    random.seed(0)
+    for _ in range(500):
+        arr = [random.choice([None, 1, 22, -333]) for _ in range(random.randint(0, 60))]
+        root = list_to_tree(arr)
+        assert captured(print_tree, root) == captured(print_tree_dfs, root), arr
+        mat = [
+            [random.randint(-5, 50) for _ in range(random.randint(0, 5))]
+            for _ in range(random.randint(0, 4))
+        ]
+        expected = "[\n" + ",\n".join("  " + str(arr) for arr in mat) + "\n]\n"
+        assert captured(print_matrix, mat) == expected, mat
+        heap = sorted(random.randint(0, 99) for _ in range(random.randint(0, 40)))
+        expected = (
+            f"Array representation of the heap: {heap}\n"
+            "Tree representation of the heap:\n"
+            + captured(print_tree_dfs, list_to_tree(heap))
+        )
+        assert captured(print_heap, heap) == expected, heap
+
+    # Truncation
+    root = list_to_tree(list(range(1, 16)))
+    res = captured(print_tree, root, max_depth=2)
+    print(res, end="")
+    assert res == (
+        "        /——— ...\n"
+        "    /——— 3\n"
+        "   |    \\——— ...\n"
+        "——— 1\n"
+        "   |    /——— ...\n"
+        "    \\——— 2\n"
+        "        \\——— ...\n"
+    )
+    res = captured(print_tree, root, max_nodes=3)
+    print(res, end="")
+    assert res == (
+        "            /——— 15\n"
+        "        /——— 7\n"
+        "       |    \\——— 14\n"
+        "... (stopped after 3 nodes)\n"
+    )
+    res = captured(print_matrix, [[1, 2, 3], [4, 5, 6], [7, 8, 9]], max_rows=2, max_cols=2)
+    print(res, end="")
+    assert res == "[\n  [1, 2, ...],\n  [4, 5, ...],\n  ... (1 more rows)\n]\n"
+    assert captured(print_tree, root, max_depth=4) == captured(print_tree_dfs, root)
+    assert captured(print_matrix, [[1, 2]], max_rows=1, max_cols=2) == "[\n  [1, 2]\n]\n"
+    # NumPy rows print as str prints them, with or without truncation
+    import numpy as np
+
+    mat = np.arange(6).reshape(2, 3)
+    assert captured(print_matrix, mat) == "[\n  [0 1 2],\n  [3 4 5]\n]\n"
+    assert captured(print_matrix, mat, max_rows=1, max_cols=2) == (
+        "[\n  [0 1 ...],\n  ... (1 more rows)\n]\n"
+    )
+    assert captured(print_matrix, [[1, 2]], max_cols=0) == "[\n  [...]\n]\n"
+
+    # A Heap prints like its array, and with d > 2 every node shows its d children
+    heap = Heap(((p, p) for p in range(9)), d=2)
+    assert captured(print_heap, heap) == captured(print_heap, list(range(9)))
+    res = captured(print_heap, Heap(((p, p) for p in range(9)), d=3))
+    print(res, end="")
+    assert res == (
+        "Array representation of the heap: [0, 1, 2, 3, 4, 5, 6, 7, 8]\n"
+        "Tree representation of the heap:\n"
+        "    /——— 3\n"
+        "   |    /——— 8\n"
+        "   |———— 2\n"
+        "   |    \\——— 7\n"
+        "——— 0\n"
+        "   |    /——— 6\n"
+        "   |   |———— 5\n"
+        "    \\——— 1\n"
+        "        \\——— 4\n"
+    )
+    print("Buffered printers match the recursive ones")
@@ -0,0 +1,219 @@
+"""
+File: serialize.py
+Created Time: 2026-10-18
+Author: phucvu-nyu
+"""
+
+from array import array
+from collections import deque
+from collections.abc import Iterator
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+
+from .arena import NIL, LinkedListArena, TreeArena, ArenaListNode, ArenaTreeNode
+from .list_node import ListNode
+from .tree_node import TreeNode
+
+# File layout, all little-endian:
+#   header: magic, kind, number of slots, number of nodes (24 bytes)
+#   values: one int64 per node, in slot order
+#   bitmap: one bit per slot, set if the slot holds a node (bit s % 8 of byte s // 8)
+# A linked list has one slot per node. A tree is stored in level order with a slot
+# for the root and for both children of every node, so unlike the array
+# representation of list_to_tree its size is linear in the number of nodes:
+# node k (counting nodes only) has its children in slots 2k + 1 and 2k + 2.
+HEADER = struct.Struct("<4sB3xQQ")
+MAGIC = b"HADS"
+LINKED_LIST, TREE = 0, 1
+# Number of values buffered before they are written
+CHUNK = 1 << 16
+
+
+def linked_list_slots(head: ListNode | None) -> Iterator[int]:
+    """Values of a linked list, one slot per node"""
+    while head:
+        yield head.val
+        head = head.next
+
+
+def tree_slots(root: TreeNode | None) -> Iterator[int | None]:
+    """Level-order slots of a binary tree, None for a missing child"""
+    if root is None:
+        return
+    yield root.val
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for child in (node.left, node.right):
+            if child is None:
+                yield None
+            else:
+                yield child.val
+                queue.append(child)
+
+
+def write_slots(path: str, kind: int, slots: Iterator[int | None]):
+    """Stream slots to a file, then patch the counts into the header"""
+    with open(path, "wb") as f:
+        # The counts are only known at the end
+        f.write(HEADER.pack(MAGIC, kind, 0, 0))
+        bitmap = bytearray()
+        buf = array("q")
+        n_slots = n_nodes = 0
+        for v in slots:
+            if n_slots % 8 == 0:
+                bitmap.append(0)
+            if v is not None:
+                bitmap[-1] |= 1 << (n_slots % 8)
+                buf.append(v)
+                n_nodes += 1
+                if len(buf) == CHUNK:
+                    write_values(f, buf)
+                    del buf[:]
+            n_slots += 1
+        write_values(f, buf)
+        f.write(bitmap)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, kind, n_slots, n_nodes))
+
+
+def write_values(f, buf: array):
+    """Write int64 values in little-endian order"""
+    if sys.byteorder == "big":
+        buf = array("q", buf)
+        buf.byteswap()
+    buf.tofile(f)
+
+
+def read_file(path: str, kind: int) -> tuple[int, array, bytes]:
+    """Map a file and copy out its values and bitmap"""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) < HEADER.size:
+            raise ValueError(f"{path} is not a serialized structure")
+        magic, file_kind, n_slots, n_nodes = HEADER.unpack_from(mm)
+        if magic != MAGIC or file_kind != kind:
+            raise ValueError(f"{path} is not a serialized {('linked list', 'tree')[kind]}")
+        start = HEADER.size
+        end = start + 8 * n_nodes
+        # A file cut short would otherwise load as a smaller structure
+        if n_nodes > n_slots or len(mm) < end + (n_slots + 7) // 8:
+            raise ValueError(f"{path} is truncated or corrupt")
+        vals = array("q")
+        # The values are copied straight from the mapped pages into the array
+        with memoryview(mm) as view:
+            vals.frombytes(view[start:end])
+        bitmap = mm[end : end + (n_slots + 7) // 8]
+    if sys.byteorder == "big":
+        vals.byteswap()
+    return n_slots, vals, bitmap
+
+
+def dump_linked_list(head: ListNode | None, path: str):
+    """Serialize a linked list to a binary file"""
+    write_slots(path, LINKED_LIST, linked_list_slots(head))
+
+
+def load_linked_list(path: str) -> ArenaListNode | None:
+    """Deserialize a linked list from a binary file into a LinkedListArena"""
+    _, vals, _ = read_file(path, LINKED_LIST)
+    arena = LinkedListArena()
+    arena.val = vals
+    arena.next = array("q", range(1, len(vals) + 1))
+    if vals:
+        arena.next[-1] = NIL
+    return arena.node(0 if vals else NIL)
+
+
+def dump_tree(root: TreeNode | None, path: str):
+    """Serialize a binary tree to a binary file"""
+    write_slots(path, TREE, tree_slots(root))
+
+
+def load_tree(path: str) -> ArenaTreeNode | None:
+    """Deserialize a binary tree from a binary file into a TreeArena"""
+    n_slots, vals, bitmap = read_file(path, TREE)
+    n = len(vals)
+    arena = TreeArena()
+    arena.val = vals
+    arena.left = array("q", [NIL]) * n
+    arena.right = array("q", [NIL]) * n
+    arena.height = array("q", [0]) * n
+    # Nodes are numbered in slot order, the node in slot s > 0 is a child of node
+    # (s - 1) // 2: its left child if s is odd, its right child otherwise
+    k = 0
+    for s in range(1, n_slots):
+        if bitmap[s >> 3] >> (s & 7) & 1:
+            k += 1
+            if s & 1:
+                arena.left[(s - 1) >> 1] = k
+            else:
+                arena.right[(s - 1) >> 1] = k
+    return arena.node(0 if n else NIL)
+
+
+"""Driver Code"""
+if __name__ == "__main__":
+    from .list_node import list_to_linked_list, linked_list_to_list
+    from .tree_node import list_to_tree, tree_to_list
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "structure.bin")
+
+        # Round trips of random lists and trees, with int64 extremes among the values
+        random.seed(0)
+        values = [-(2**63), 2**63 - 1, 0, -1, 1]
+        for _ in range(200):
+            arr = [random.choice(values) for _ in range(random.randint(0, 30))]
+            dump_linked_list(list_to_linked_list(arr), path)
+            assert linked_list_to_list(load_linked_list(path)) == arr
+            arr = [random.choice(values + [None]) for _ in range(random.randint(0, 30))]
+            root = list_to_tree(arr)
+            dump_tree(root, path)
+            assert tree_to_list(load_tree(path)) == tree_to_list(root)
+
+        # A right-skewed tree of depth 10^5, beyond the list representation and recursion
+        n = 100_000
+        root = node = TreeNode(0)
+        for i in range(1, n):
+            node.right = TreeNode(i)
+            node = node.right
+        dump_tree(root, path)
+        print(f"Skewed tree of {n} nodes: {os.path.getsize(path)} bytes")
+        node, i = load_tree(path), 0
+        while node:
+            assert node.val == i and node.left is None
+            node, i = node.right, i + 1
+        assert i == n
+        # The list representation would need about 2^n entries
+        try:
+            tree_to_list(root)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("tree_to_list accepted a skewed tree of depth 10^5")
+
+        # Truncated files are rejected
+        dump_linked_list(list_to_linked_list(list(range(10))), path)
+        for size in [HEADER.size + 8 * 6, HEADER.size - 1]:
+            with open(path, "r+b") as f:
+                f.truncate(size)
+            try:
+                load_linked_list(path)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("a truncated linked list file was loaded")
+        dump_tree(list_to_tree([1, 2, 3, None, 4]), path)
+        with open(path, "r+b") as f:
+            f.truncate(HEADER.size + 8 * 4)
+        try:
+            load_tree(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("a tree file without its bitmap was loaded")
+    print("All round trips match, truncated files are rejected")
@@ -10,6 +10,8 @@ from collections import deque
 class TreeNode:
     """Binary tree node class"""
 
+    __slots__ = ("val", "height", "left", "right")
+
     def __init__(self, val: int = 0):
         self.val: int = val  # Node value
         self.height: int = 0  # Node height
@@ -46,9 +48,29 @@ def list_to_tree_dfs(arr: list[int], i: int) -> TreeNode | None:
     return root
 
 
+def list_to_tree_bfs(arr: list[int]) -> TreeNode | None:
+    """Deserialize a list into a binary tree: Level-order traversal, no recursion"""
+    if not arr or arr[0] is None:
+        return None
+    root = TreeNode(arr[0])
+    queue = deque([(root, 0)])
+    while queue:
+        node, i = queue.popleft()
+        # Only the children of nodes reached from the root are constructed
+        for j in (2 * i + 1, 2 * i + 2):
+            if j < len(arr) and arr[j] is not None:
+                child = TreeNode(arr[j])
+                if j == 2 * i + 1:
+                    node.left = child
+                else:
+                    node.right = child
+                queue.append((child, j))
+    return root
+
+
 def list_to_tree(arr: list[int]) -> TreeNode | None:
     """Deserialize a list into a binary tree"""
-    return list_to_tree_dfs(arr, 0)
+    return list_to_tree_bfs(arr)
 
 
 def tree_to_list_dfs(root: TreeNode, i: int, res: list[int]) -> list[int]:
@@ -62,8 +84,41 @@ def tree_to_list_dfs(root: TreeNode, i: int, res: list[int]) -> list[int]:
     tree_to_list_dfs(root.right, 2 * i + 2, res)
 
 
+def tree_to_list_bfs(root: TreeNode | None) -> list[int]:
+    """Serialize a binary tree into a list: Level-order traversal, no recursion"""
+    if root is None:
+        return []
+    # First pass: the largest index decides the length of the list
+    size = count = 0
+    queue = deque([(root, 0)])
+    while queue:
+        node, i = queue.popleft()
+        size = max(size, i + 1)
+        count += 1
+        if node.left:
+            queue.append((node.left, 2 * i + 1))
+        if node.right:
+            queue.append((node.right, 2 * i + 2))
+    # Indices double with every level, so a skewed tree of depth d needs a list of
+    # about 2^d entries; fail before allocating it rather than with a MemoryError
+    if size > max(1 << 20, 16 * count):
+        raise ValueError(
+            "the list representation needs about 2^depth entries, "
+            f"about 2^{size.bit_length() - 1} for this tree of {count} nodes"
+        )
+    res = [None] * size
+    # Second pass: fill in the values
+    queue = deque([(root, 0)])
+    while queue:
+        node, i = queue.popleft()
+        res[i] = node.val
+        if node.left:
+            queue.append((node.left, 2 * i + 1))
+        if node.right:
+            queue.append((node.right, 2 * i + 2))
+    return res
+
+
 def tree_to_list(root: TreeNode | None) -> list[int]:
     """Serialize a binary tree into a list"""
-    res = []
-    tree_to_list_dfs(root, 0, res)
-    return res
+    return tree_to_list_bfs(root)
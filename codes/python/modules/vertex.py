@@ -6,6 +6,8 @@
 class Vertex:
     """Vertex class"""
 
+    __slots__ = ("val",)
+
     def __init__(self, val: int):
         self.val = val
 
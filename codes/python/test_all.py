@@ -1,33 +1,147 @@
 import os
+import sys
 import glob
+import json
+import argparse
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from timeit import default_timer as timer
+from xml.etree import ElementTree
 
 env = os.environ.copy()
 env["PYTHONIOENCODING"] = "utf-8"
 
-if __name__ == "__main__":
-    # find source code files
-    src_paths = sorted(glob.glob("en/codes/python/chapter_*/*.py"))
-    errors = []
-
-    # run python code
-    for src_path in src_paths:
-        process = subprocess.Popen(
-            ["python", src_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+# Directory of this file, so the runner works from any working directory
+root = os.path.dirname(os.path.abspath(__file__))
+
+# Files that are not meant to run: python_style.py shows style examples that
+# import a placeholder module and call undefined functions
+EXCLUDE = {os.path.join("chapter_coding", "python_style.py")}
+
+
+def command(src_path: str) -> list[str]:
+    """Interpreter command line for one source file"""
+    rel = os.path.relpath(os.path.abspath(src_path), root)
+    if os.path.dirname(rel) == "modules":
+        # Files of the modules package use relative imports, so they run with -m.
+        # runpy warns that the package __init__ already imported them, which is harmless
+        name = "modules." + os.path.splitext(os.path.basename(rel))[0]
+        return [sys.executable, "-W", "ignore::RuntimeWarning:runpy", "-m", name]
+    return [sys.executable, src_path]
+
+
+def has_driver(src_path: str) -> bool:
+    """Whether a file has a Driver Code block to run"""
+    with open(src_path, encoding="utf-8") as f:
+        return 'if __name__ == "__main__":' in f.read()
+
+
+def run_file(src_path: str, timeout: float) -> dict:
+    """Run one source file in its own interpreter, capturing output and duration"""
+    start = timer()
+    try:
+        process = subprocess.run(
+            command(src_path),
+            cwd=root,
+            capture_output=True,
             text=True,
             env=env,
-            encoding='utf-8'
+            encoding="utf-8",
+            timeout=timeout,
         )
-        # Wait for the process to complete, and get the output and error messages
-        stdout, stderr = process.communicate()
-        # Check the exit status
-        exit_status = process.returncode
-        if exit_status != 0:
-            errors.append(stderr)
-
-    print(f"Tested {len(src_paths)} files")
+        status = "passed" if process.returncode == 0 else "failed"
+        stdout, stderr = process.stdout, process.stderr
+    except subprocess.TimeoutExpired as e:
+        # subprocess.run kills the child before raising
+        status = "timeout"
+        stdout = e.stdout or ""
+        # The partial output is bytes even in text mode
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode("utf-8", "replace")
+        stderr = f"Timed out after {timeout} s"
+    return {
+        "file": os.path.relpath(src_path, root),
+        "status": status,
+        "seconds": timer() - start,
+        "stdout": stdout,
+        "stderr": stderr,
+    }
+
+
+def write_junit(path: str, results: list[dict], seconds: float):
+    """Write the results as a JUnit XML test suite"""
+    failures = sum(r["status"] == "failed" for r in results)
+    errors = sum(r["status"] == "timeout" for r in results)
+    suite = ElementTree.Element(
+        "testsuite",
+        name="codes.python",
+        tests=str(len(results)),
+        failures=str(failures),
+        errors=str(errors),
+        time=f"{seconds:.3f}",
+    )
+    for r in results:
+        case = ElementTree.SubElement(
+            suite,
+            "testcase",
+            classname=os.path.dirname(r["file"]).replace(os.sep, "."),
+            name=os.path.basename(r["file"]),
+            time=f"{r['seconds']:.3f}",
+        )
+        if r["status"] == "failed":
+            ElementTree.SubElement(case, "failure", message="non-zero exit status").text = r["stderr"]
+        elif r["status"] == "timeout":
+            ElementTree.SubElement(case, "error", message=r["stderr"])
+        ElementTree.SubElement(case, "system-out").text = r["stdout"]
+    ElementTree.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run every chapter source file")
+    parser.add_argument("paths", nargs="*", help="files to run (default: chapter_*/*.py and modules with a driver)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="concurrent files")
+    parser.add_argument("--timeout", type=float, default=300, help="per-file timeout in seconds")
+    parser.add_argument("--junit", help="write a JUnit XML report to this file")
+    parser.add_argument("--json", help="write a JSON report to this file")
+    parser.add_argument("--slowest", type=int, default=0, metavar="N", help="list the N slowest files")
+    args = parser.parse_args()
+
+    # find source code files, and the files of the modules package with a driver
+    src_paths = args.paths or [
+        path
+        for path in sorted(glob.glob(os.path.join(root, "chapter_*", "*.py")))
+        if os.path.relpath(path, root) not in EXCLUDE
+    ] + [
+        path
+        for path in sorted(glob.glob(os.path.join(root, "modules", "*.py")))
+        if has_driver(path)
+    ]
+    results = []
+
+    # run python code, several files at a time
+    start = timer()
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(run_file, src_path, args.timeout) for src_path in src_paths]
+        for future in as_completed(futures):
+            r = future.result()
+            results.append(r)
+            print(f"{r['status']:>7} {r['seconds']:8.2f} s  {r['file']}", flush=True)
+    seconds = timer() - start
+    results.sort(key=lambda r: r["file"])
+
+    if args.junit:
+        write_junit(args.junit, results, seconds)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"seconds": seconds, "results": results}, f, indent=2)
+
+    if args.slowest:
+        print(f"\nSlowest {args.slowest} files:")
+        for r in sorted(results, key=lambda r: r["seconds"], reverse=True)[: args.slowest]:
+            print(f"{r['seconds']:8.2f} s  {r['file']}")
+
+    errors = [f"{r['file']}:\n{r['stderr']}" for r in results if r["status"] != "passed"]
+    print(f"\nTested {len(src_paths)} files in {seconds:.2f} s")
     print(f"Found exception in {len(errors)} files")
     if len(errors) > 0:
         raise RuntimeError("\n\n".join(errors))